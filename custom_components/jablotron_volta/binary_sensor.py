@@ -17,7 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import JablotronVoltaCoordinator
+from .coordinator import JablotronVoltaCoordinator, is_ch2_available
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,7 +48,7 @@ BINARY_SENSOR_TYPES: tuple[JablotronVoltaBinarySensorEntityDescription, ...] = (
         translation_key="ch2_heating",
         device_class=BinarySensorDeviceClass.HEAT,
         value_fn=lambda data: data.get("ch2_state_heat", False),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaBinarySensorEntityDescription(
         key="system_alert",
@@ -58,6 +58,11 @@ BINARY_SENSOR_TYPES: tuple[JablotronVoltaBinarySensorEntityDescription, ...] = (
     ),
 )
 
+_BASE_BINARY_SENSORS = tuple(d for d in BINARY_SENSOR_TYPES if d.available_fn is None)
+_CONDITIONAL_BINARY_SENSORS = tuple(
+    d for d in BINARY_SENSOR_TYPES if d.available_fn is not None
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -67,13 +72,15 @@ async def async_setup_entry(
     """Set up Jablotron Volta binary sensors."""
     coordinator: JablotronVoltaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[BinarySensorEntity] = []
-
-    for description in BINARY_SENSOR_TYPES:
-        if description.available_fn and not description.available_fn(coordinator):
-            continue
-
-        entities.append(JablotronVoltaBinarySensor(coordinator, entry, description))
+    entities: list[BinarySensorEntity] = [
+        JablotronVoltaBinarySensor(coordinator, entry, description)
+        for description in _BASE_BINARY_SENSORS
+    ]
+    entities.extend(
+        JablotronVoltaBinarySensor(coordinator, entry, description)
+        for description in _CONDITIONAL_BINARY_SENSORS
+        if description.available_fn(coordinator)
+    )
 
     async_add_entities(entities)
 
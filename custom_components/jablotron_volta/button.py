@@ -76,18 +76,10 @@ class JablotronVoltaResetErrorButton(JablotronVoltaButtonBase):
     async def async_press(self) -> None:
         """Handle the button press."""
         # Write 0 to attention register to reset
-        success1 = await self.hass.async_add_executor_job(
-            self.coordinator.client.write_register,
-            REG_SYS_ATTENTION_0,
-            0,
-        )
+        success1 = await self.coordinator.async_write_register(REG_SYS_ATTENTION_0, 0)
 
         # Also try to reset error code if system access is available
-        success2 = await self.hass.async_add_executor_job(
-            self.coordinator.client.write_register,
-            REG_SYS_ERROR_CODE,
-            0,
-        )
+        success2 = await self.coordinator.async_write_register(REG_SYS_ERROR_CODE, 0)
 
         if success1 or success2:
             await self.coordinator.async_request_refresh()
@@ -110,11 +102,7 @@ class JablotronVoltaRestartButton(JablotronVoltaButtonBase):
     async def async_press(self) -> None:
         """Handle the button press."""
         # Write non-zero value to trigger restart
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.client.write_register,
-            REG_SYS_RESET,
-            1,
-        )
+        success = await self.coordinator.async_write_register(REG_SYS_RESET, 1)
 
         if success:
             _LOGGER.warning(
@@ -128,11 +128,7 @@ class JablotronVoltaDHWClimate(JablotronVoltaClimateBase):
         elif hvac_mode == HVACMode.AUTO:
             mode_value = DHW_MODE_SCHEDULE
 
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.client.write_register,
-            REG_DHW_MODE,
-            mode_value,
-        )
+        success = await self.coordinator.async_write_register(REG_DHW_MODE, mode_value)
 
         if success:
             await self.coordinator.async_request_refresh()
@@ -147,10 +143,8 @@ class JablotronVoltaDHWClimate(JablotronVoltaClimateBase):
         # Write to manual temperature register
         temp_value = self.coordinator.client.unscale_temperature(temperature)
 
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.client.write_register,
-            REG_DHW_TEMPER_MANUAL,
-            temp_value,
+        success = await self.coordinator.async_write_register(
+            REG_DHW_TEMPER_MANUAL, temp_value
         )
 
         if success:
@@ -226,11 +220,7 @@ class JablotronVoltaHeatingCircuitClimate(JablotronVoltaClimateBase):
 
         mode_register = REG_CH1_MODE if self._circuit == 1 else REG_CH2_MODE
 
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.client.write_register,
-            mode_register,
-            mode_value,
-        )
+        success = await self.coordinator.async_write_register(mode_register, mode_value)
 
         if success:
             await self.coordinator.async_request_refresh()
@@ -251,11 +241,7 @@ class JablotronVoltaHeatingCircuitClimate(JablotronVoltaClimateBase):
             REG_CH1_TEMPER_MANUAL if self._circuit == 1 else REG_CH2_TEMPER_MANUAL
         )
 
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.client.write_register,
-            temp_register,
-            temp_value,
-        )
+        success = await self.coordinator.async_write_register(temp_register, temp_value)
 
         if success:
             await self.coordinator.async_request_refresh()
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Any
+import sys
+import threading
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
+from typing import Any, Concatenate, ParamSpec
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT
@@ -34,21 +39,45 @@ from .scaling import (
 _LOGGER = logging.getLogger(__name__)
 
 
+_P = ParamSpec("_P")
+_ParseFn = Callable[..., Mapping[str, Any]]
+# A parse function taking registers plus extra parameters (e.g. prefix)
+_RegisterParser = Callable[Concatenate[list[int], _P], Mapping[str, Any]]
+
+# Shared read-only result for sections with too few registers
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _min_len(count: int) -> Callable[[_RegisterParser[_P]], _RegisterParser[_P]]:
+    """Make a parse function return an empty mapping for too few registers."""
+
+    def decorator(func: _RegisterParser[_P]) -> _RegisterParser[_P]:
+        @functools.wraps(func)
+        def wrapper(
+            registers: list[int], *args: _P.args, **kwargs: _P.kwargs
+        ) -> Mapping[str, Any]:
+            if len(registers) < count:
+                return _EMPTY
+            return func(registers, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 # ---------------------------------------------------------------------------
-# Pure parse functions: list[int] -> dict[str, Any]
+# Pure parse functions: list[int] -> Mapping[str, Any]
 # Each takes the raw register array from a specific batch and returns
 # the parsed key-value pairs. No I/O, no side effects, easy to test.
 # ---------------------------------------------------------------------------
 
 
-def parse_device_info(registers: list[int]) -> dict[str, Any]:
+@_min_len(11)
+def parse_device_info(registers: list[int]) -> Mapping[str, Any]:
     """Parse device information registers (11 registers).
 
     Returns serial_number, firmware_version, hardware_version, mac_address.
     """
-    if len(registers) < 11:
-        return {}
-
     serial_number = str(registers_to_uint32(registers[0], registers[1]))
 
     fw_high = registers[9]
@@ -69,10 +98,9 @@ def parse_device_info(registers: list[int]) -> dict[str, Any]:
     }
 
 
-def parse_network_info(registers: list[int]) -> dict[str, Any]:
+@_min_len(6)
+def parse_network_info(registers: list[int]) -> Mapping[str, Any]:
     """Parse network information registers (6 registers)."""
-    if len(registers) < 6:
-        return {}
     return {
         "ip_address": registers_to_ip(registers[0], registers[1]),
         "subnet_mask": registers_to_ip(registers[2], registers[3]),
@@ -80,20 +108,18 @@ def parse_network_info(registers: list[int]) -> dict[str, Any]:
     }
 
 
-def parse_system_status(registers: list[int]) -> dict[str, Any]:
+@_min_len(2)
+def parse_system_status(registers: list[int]) -> Mapping[str, Any]:
     """Parse system status registers (2 registers)."""
-    if len(registers) < 2:
-        return {}
     return {
         "cpu_temperature": scale_temperature(registers[0]),
         "battery_voltage": scale_voltage(registers[1]),
     }
 
 
-def parse_regulation(registers: list[int]) -> dict[str, Any]:
+@_min_len(3)
+def parse_regulation(registers: list[int]) -> Mapping[str, Any]:
     """Parse regulation registers (3 registers)."""
-    if len(registers) < 3:
-        return {}
     return {
         "regulation_mode_current": registers[0],
         "outdoor_temp_damped": scale_signed_temperature(registers[1]),
@@ -101,10 +127,9 @@ def parse_regulation(registers: list[int]) -> dict[str, Any]:
     }
 
 
-def parse_boiler_status(registers: list[int]) -> dict[str, Any]:
+@_min_len(10)
+def parse_boiler_status(registers: list[int]) -> Mapping[str, Any]:
     """Parse boiler status registers (10 registers)."""
-    if len(registers) < 10:
-        return {}
     return {
         "boiler_active_segments": registers[0],
         "boiler_inactive_segments": registers[1],
@@ -118,49 +143,83 @@ def parse_boiler_status(registers: list[int]) -> dict[str, Any]:
     }
 
 
-def parse_dhw_status(registers: list[int]) -> dict[str, Any]:
+@_min_len(2)
+def parse_dhw_status(registers: list[int]) -> Mapping[str, Any]:
     """Parse DHW status registers (2 registers)."""
-    if len(registers) < 2:
-        return {}
     return {
-        "dhw_state_heat": bool(registers[0]),
+        "dhw_state_heat": registers[0] != 0,
         "dhw_temperature_current": scale_temperature(registers[1]),
     }
 
 
-def parse_ch_status(registers: list[int], prefix: str) -> dict[str, Any]:
+_CH_PREFIXES = ("ch1", "ch2")
+
+
+def _ch_keys(
+    keys_by_prefix: Mapping[str, tuple[str, ...]], prefix: str
+) -> tuple[str, ...]:
+    """Return the precomputed data keys for a heating circuit prefix."""
+    try:
+        return keys_by_prefix[prefix]
+    except KeyError:
+        raise ValueError(
+            f"Unknown heating circuit prefix {prefix!r}, expected one of {_CH_PREFIXES}"
+        ) from None
+
+
+_CH_STATUS_FIELDS = (
+    "state_heat",
+    "temperature_current",
+    "water_input_temp",
+    "water_return_temp",
+    "pump_power",
+    "humidity",
+    "co2",
+)
+
+# Heating circuit status keys per prefix, built once at import
+_CH_STATUS_KEYS: dict[str, tuple[str, ...]] = {
+    prefix: tuple(sys.intern(f"{prefix}_{field}") for field in _CH_STATUS_FIELDS)
+    for prefix in _CH_PREFIXES
+}
+
+
+@_min_len(7)
+def parse_ch_status(registers: list[int], prefix: str) -> Mapping[str, Any]:
     """Parse heating circuit status registers (7 registers).
 
     Args:
         registers: Raw register values.
-        prefix: "ch1" or "ch2".
+        prefix: "ch1" or "ch2"; any other prefix raises ValueError.
     """
-    if len(registers) < 7:
-        return {}
-    return {
-        f"{prefix}_state_heat": bool(registers[0]),
-        f"{prefix}_temperature_current": scale_temperature(registers[1]),
-        f"{prefix}_water_input_temp": scale_temperature(registers[2]),
-        f"{prefix}_water_return_temp": scale_temperature(registers[3]),
-        f"{prefix}_pump_power": scale_percentage(registers[4]),
-        f"{prefix}_humidity": scale_percentage(registers[5]),
-        f"{prefix}_co2": scale_percentage(registers[6]),
-    }
+    return dict(
+        zip(
+            _ch_keys(_CH_STATUS_KEYS, prefix),
+            (
+                registers[0] != 0,
+                scale_temperature(registers[1]),
+                scale_temperature(registers[2]),
+                scale_temperature(registers[3]),
+                scale_percentage(registers[4]),
+                scale_percentage(registers[5]),
+                scale_percentage(registers[6]),
+            ),
+            strict=True,
+        )
+    )
 
 
-def parse_system_alerts(registers: list[int]) -> dict[str, Any]:
+@_min_len(2)
+def parse_system_alerts(registers: list[int]) -> Mapping[str, Any]:
     """Parse system alert registers (2 registers)."""
-    if len(registers) < 2:
-        return {}
     return {
         "system_attention": registers_to_uint32(registers[0], registers[1]),
     }
 
 
-def parse_regulation_settings(registers: list[int]) -> dict[str, Any]:
+@_min_len(6)
+def parse_regulation_settings(registers: list[int]) -> Mapping[str, Any]:
     """Parse regulation settings registers (6 registers)."""
-    if len(registers) < 6:
-        return {}
     return {
         "regulation_mode_user": registers[0],
         "outdoor_temp_source": registers[1],
@@ -171,10 +230,9 @@ def parse_regulation_settings(registers: list[int]) -> dict[str, Any]:
     }
 
 
-def parse_boiler_settings(registers: list[int]) -> dict[str, Any]:
+@_min_len(7)
+def parse_boiler_settings(registers: list[int]) -> Mapping[str, Any]:
     """Parse boiler settings registers (13 registers, we use first 7)."""
-    if len(registers) < 7:
-        return {}
     return {
         "boiler_load_release": registers[0],
         "boiler_hdo_high_tariff": registers[1],
@@ -186,14 +244,13 @@ def parse_boiler_settings(registers: list[int]) -> dict[str, Any]:
     }
 
 
-def parse_dhw_settings(registers: list[int]) -> dict[str, Any]:
+@_min_len(8)
+def parse_dhw_settings(registers: list[int]) -> Mapping[str, Any]:
     """Parse DHW settings registers (8 registers).
 
     Note: index 5 (register 1105) is a gap, index 6 = hysteresis (1106),
     index 7 = regulation strategy (1107).
     """
-    if len(registers) < 8:
-        return {}
     return {
         "dhw_mode": registers[0],
         "dhw_temperature_desired": scale_temperature(registers[1]),
@@ -205,43 +262,77 @@ def parse_dhw_settings(registers: list[int]) -> dict[str, Any]:
     }
 
 
-def parse_ch_settings(registers: list[int], prefix: str) -> dict[str, Any]:
+_CH_SETTINGS_FIELDS = (
+    "mode",
+    "temperature_desired",
+    "temperature_min",
+    "temperature_max",
+    "temperature_manual",
+    "temperature_antifrost",
+    "hysteresis",
+    "regulation_strategy",
+    "water_temp_min",
+    "water_temp_max",
+    "water_setpoint",
+    "equitherm_slope",
+    "equitherm_offset",
+    "equitherm_room_effect",
+    "threshold_setpoint",
+    "limit_heat_temp",
+    "optimal_start",
+    "fast_cooldown",
+    "temp_correction",
+    "humidity_correction",
+)
+
+# Heating circuit settings keys per prefix, built once at import
+_CH_SETTINGS_KEYS: dict[str, tuple[str, ...]] = {
+    prefix: tuple(sys.intern(f"{prefix}_{field}") for field in _CH_SETTINGS_FIELDS)
+    for prefix in _CH_PREFIXES
+}
+
+
+@_min_len(20)
+def parse_ch_settings(registers: list[int], prefix: str) -> Mapping[str, Any]:
     """Parse heating circuit settings registers (20 registers).
 
     Args:
         registers: Raw register values.
-        prefix: "ch1" or "ch2".
+        prefix: "ch1" or "ch2"; any other prefix raises ValueError.
     """
-    if len(registers) < 20:
-        return {}
-    return {
-        f"{prefix}_mode": registers[0],
-        f"{prefix}_temperature_desired": scale_temperature(registers[1]),
-        f"{prefix}_temperature_min": scale_temperature(registers[2]),
-        f"{prefix}_temperature_max": scale_temperature(registers[3]),
-        f"{prefix}_temperature_manual": scale_temperature(registers[4]),
-        f"{prefix}_temperature_antifrost": scale_temperature(registers[5]),
-        f"{prefix}_hysteresis": scale_temperature(registers[6]),
-        f"{prefix}_regulation_strategy": registers[7],
-        f"{prefix}_water_temp_min": scale_temperature(registers[8]),
-        f"{prefix}_water_temp_max": scale_temperature(registers[9]),
-        f"{prefix}_water_setpoint": scale_temperature(registers[10]),
-        f"{prefix}_equitherm_slope": scale_ratio(registers[11]),
-        f"{prefix}_equitherm_offset": scale_signed_temperature(registers[12]),
-        f"{prefix}_equitherm_room_effect": registers[13],
-        f"{prefix}_threshold_setpoint": scale_temperature(registers[14]),
-        f"{prefix}_limit_heat_temp": scale_temperature(registers[15]),
-        f"{prefix}_optimal_start": bool(registers[16]),
-        f"{prefix}_fast_cooldown": bool(registers[17]),
-        f"{prefix}_temp_correction": scale_signed_temperature(registers[18]),
-        f"{prefix}_humidity_correction": scale_signed_percentage(registers[19]),
-    }
+    return dict(
+        zip(
+            _ch_keys(_CH_SETTINGS_KEYS, prefix),
+            (
+                registers[0],
+                scale_temperature(registers[1]),
+                scale_temperature(registers[2]),
+                scale_temperature(registers[3]),
+                scale_temperature(registers[4]),
+                scale_temperature(registers[5]),
+                scale_temperature(registers[6]),
+                registers[7],
+                scale_temperature(registers[8]),
+                scale_temperature(registers[9]),
+                scale_temperature(registers[10]),
+                scale_ratio(registers[11]),
+                scale_signed_temperature(registers[12]),
+                registers[13],
+                scale_temperature(registers[14]),
+                scale_temperature(registers[15]),
+                registers[16] != 0,
+                registers[17] != 0,
+                scale_signed_temperature(registers[18]),
+                scale_signed_percentage(registers[19]),
+            ),
+            strict=True,
+        )
+    )
 
 
-def parse_system_control(registers: list[int]) -> dict[str, Any]:
+@_min_len(10)
+def parse_system_control(registers: list[int]) -> Mapping[str, Any]:
     """Parse system control registers (10 registers)."""
-    if len(registers) < 10:
-        return {}
     return {
         "control_mode": registers[1],
         "error_code": registers[3],
@@ -251,6 +342,25 @@ def parse_system_control(registers: list[int]) -> dict[str, Any]:
     }
 
 
+# Raw section name -> parser, in merge order. device_info is handled separately.
+_SECTION_PARSERS: tuple[tuple[str, _ParseFn], ...] = (
+    ("network_info", parse_network_info),
+    ("system_status", parse_system_status),
+    ("regulation", parse_regulation),
+    ("boiler_status", parse_boiler_status),
+    ("dhw_status", parse_dhw_status),
+    ("ch1_status", functools.partial(parse_ch_status, prefix="ch1")),
+    ("ch2_status", functools.partial(parse_ch_status, prefix="ch2")),
+    ("system_alerts", parse_system_alerts),
+    ("regulation_settings", parse_regulation_settings),
+    ("boiler_settings", parse_boiler_settings),
+    ("dhw_settings", parse_dhw_settings),
+    ("ch1_settings", functools.partial(parse_ch_settings, prefix="ch1")),
+    ("ch2_settings", functools.partial(parse_ch_settings, prefix="ch2")),
+    ("system_control", parse_system_control),
+)
+
+
 def process_raw_data(raw_data: dict[str, Any]) -> dict[str, Any]:
     """Process raw register data into structured format.
 
@@ -264,47 +374,10 @@ def process_raw_data(raw_data: dict[str, Any]) -> dict[str, Any]:
         # Store parsed device info — coordinator extracts metadata from it
         data["_device_meta"] = parse_device_info(raw_data["device_info"])
 
-    if "network_info" in raw_data:
-        data.update(parse_network_info(raw_data["network_info"]))
-
-    if "system_status" in raw_data:
-        data.update(parse_system_status(raw_data["system_status"]))
-
-    if "regulation" in raw_data:
-        data.update(parse_regulation(raw_data["regulation"]))
-
-    if "boiler_status" in raw_data:
-        data.update(parse_boiler_status(raw_data["boiler_status"]))
-
-    if "dhw_status" in raw_data:
-        data.update(parse_dhw_status(raw_data["dhw_status"]))
-
-    if "ch1_status" in raw_data:
-        data.update(parse_ch_status(raw_data["ch1_status"], "ch1"))
-
-    if "ch2_status" in raw_data:
-        data.update(parse_ch_status(raw_data["ch2_status"], "ch2"))
-
-    if "system_alerts" in raw_data:
-        data.update(parse_system_alerts(raw_data["system_alerts"]))
-
-    if "regulation_settings" in raw_data:
-        data.update(parse_regulation_settings(raw_data["regulation_settings"]))
-
-    if "boiler_settings" in raw_data:
-        data.update(parse_boiler_settings(raw_data["boiler_settings"]))
-
-    if "dhw_settings" in raw_data:
-        data.update(parse_dhw_settings(raw_data["dhw_settings"]))
-
-    if "ch1_settings" in raw_data:
-        data.update(parse_ch_settings(raw_data["ch1_settings"], "ch1"))
-
-    if "ch2_settings" in raw_data:
-        data.update(parse_ch_settings(raw_data["ch2_settings"], "ch2"))
-
-    if "system_control" in raw_data:
-        data.update(parse_system_control(raw_data["system_control"]))
+    for section, parser in _SECTION_PARSERS:
+        registers = raw_data.get(section)
+        if registers is not None:
+            data.update(parser(registers))
 
     return data
 
@@ -343,6 +416,15 @@ class JablotronVoltaCoordinator(DataUpdateCoordinator):
         self._hardware_version: str | None = None
         self._mac_address: str | None = None
         self._ch2_available: bool = False
+        self._device_info: dict[str, Any] | None = None
+
+        # Last raw register snapshot and its processed data (poll cache)
+        self._last_raw: dict[str, Any] | None = None
+        self._last_processed: dict[str, Any] = {}
+
+        # Held by executor jobs using the (not thread-safe) sync client, so a
+        # register write never overlaps a poll or another write
+        self._client_lock = threading.Lock()
 
         super().__init__(
             hass,
@@ -353,23 +435,36 @@ class JablotronVoltaCoordinator(DataUpdateCoordinator):
 
     @property
     def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self.entry.entry_id)},
-            "name": f"{MANUFACTURER} {MODEL}",
-            "manufacturer": MANUFACTURER,
-            "model": MODEL,
-            "sw_version": self._firmware_version,
-            "hw_version": self._hardware_version,
-            "serial_number": self._serial_number,
-            "configuration_url": f"http://{self.entry.data[CONF_HOST]}",
-        }
+        """Return device information, shared by all entities until it changes."""
+        if self._device_info is None:
+            self._device_info = {
+                "identifiers": {(DOMAIN, self.entry.entry_id)},
+                "name": f"{MANUFACTURER} {MODEL}",
+                "manufacturer": MANUFACTURER,
+                "model": MODEL,
+                "sw_version": self._firmware_version,
+                "hw_version": self._hardware_version,
+                "serial_number": self._serial_number,
+                "configuration_url": f"http://{self.entry.data[CONF_HOST]}",
+            }
+        return self._device_info
 
     @property
     def ch2_available(self) -> bool:
         """Return True if Heating Circuit 2 is available."""
         return self._ch2_available
 
+    async def async_write_register(self, address: int, value: int) -> bool:
+        """Write a single register from the event loop."""
+        return await self.hass.async_add_executor_job(
+            self._write_register, address, value
+        )
+
+    def _write_register(self, address: int, value: int) -> bool:
+        """Write a register under the client lock (runs in executor)."""
+        with self._client_lock:
+            return self.client.write_register(address, value)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from device."""
         try:
@@ -377,33 +472,70 @@ class JablotronVoltaCoordinator(DataUpdateCoordinator):
         except Exception as err:
             raise UpdateFailed(f"Error communicating with device: {err}") from err
 
+    def _update_device_meta(self, device_meta: Mapping[str, Any]) -> None:
+        """Store device metadata, invalidating cached device info on change."""
+        meta = (
+            device_meta.get("serial_number"),
+            device_meta.get("firmware_version"),
+            device_meta.get("hardware_version"),
+            device_meta.get("mac_address"),
+        )
+        if meta == (
+            self._serial_number,
+            self._firmware_version,
+            self._hardware_version,
+            self._mac_address,
+        ):
+            return
+        (
+            self._serial_number,
+            self._firmware_version,
+            self._hardware_version,
+            self._mac_address,
+        ) = meta
+        self._device_info = None
+
     def _fetch_data(self) -> dict[str, Any]:
         """Fetch data from Modbus device (runs in executor)."""
-        if not self.client.connect():
-            raise UpdateFailed("Cannot connect to device")
+        with self._client_lock:
+            if not self.client.connect():
+                raise UpdateFailed("Cannot connect to device")
 
-        try:
-            # Read all data using batched operations
-            raw_data = self.client.read_all_data()
+            try:
+                # Read all data using batched operations
+                raw_data = self.client.read_all_data()
+
+                if not raw_data:
+                    raise UpdateFailed("No data received from device")
+
+                if raw_data == self._last_raw:
+                    # Registers unchanged since the last poll: skip parsing
+                    processed_data = dict(self._last_processed)
+                else:
+                    # Process and structure the data (pure function)
+                    processed_data = process_raw_data(raw_data)
 
-            if not raw_data:
-                raise UpdateFailed("No data received from device")
+                    # Extract device metadata (side effect: updates coordinator state)
+                    device_meta = processed_data.pop("_device_meta", {})
+                    if device_meta:
+                        self._update_device_meta(device_meta)
 
-            # Process and structure the data (pure function)
-            processed_data = process_raw_data(raw_data)
+                    self._last_raw = raw_data
+                    self._last_processed = processed_data
+                    processed_data = dict(processed_data)
 
-            # Extract device metadata (side effect: updates coordinator state)
-            device_meta = processed_data.pop("_device_meta", {})
-            if device_meta:
-                self._serial_number = device_meta.get("serial_number")
-                self._firmware_version = device_meta.get("firmware_version")
-                self._hardware_version = device_meta.get("hardware_version")
-                self._mac_address = device_meta.get("mac_address")
+                # Update CH2 availability flag
+                self._ch2_available = raw_data.get("ch2_available", False)
 
-            # Update CH2 availability flag
-            self._ch2_available = raw_data.get("ch2_available", False)
+                return processed_data
 
-            return processed_data
+            finally:
+                self.client.close()
 
-        finally:
-            self.client.close()
+
+def is_ch2_available(coordinator: JablotronVoltaCoordinator) -> bool:
+    """Return True when heating circuit 2 was detected.
+
+    Shared ``available_fn`` for every CH2-gated entity description.
+    """
+    return coordinator.ch2_available
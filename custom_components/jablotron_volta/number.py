@@ -51,7 +51,7 @@ from .const import (
     REG_REGU_TEMPER_CHANGEOVER,
     REG_REGU_TEMPER_OUTSIDE,
 )
-from .coordinator import JablotronVoltaCoordinator
+from .coordinator import JablotronVoltaCoordinator, is_ch2_available
 from .scaling import (
     unscale_ratio,
     unscale_signed_percentage,
@@ -315,7 +315,7 @@ NUMBER_TYPES: tuple[JablotronVoltaNumberEntityDescription, ...] = (
         register=REG_CH2_TEMPER_ANTIFROST,
         value_fn=lambda data: data.get("ch2_temperature_antifrost"),
         scale_fn=unscale_temperature,
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaNumberEntityDescription(
         key="ch2_hysteresis",
@@ -328,7 +328,7 @@ NUMBER_TYPES: tuple[JablotronVoltaNumberEntityDescription, ...] = (
         register=REG_CH2_TEMPER_HYSTERESIS,
         value_fn=lambda data: data.get("ch2_hysteresis"),
         scale_fn=unscale_temperature,
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaNumberEntityDescription(
         key="ch2_water_temp_min",
@@ -341,7 +341,7 @@ NUMBER_TYPES: tuple[JablotronVoltaNumberEntityDescription, ...] = (
         register=REG_CH2_TEMPER_WATER_MIN,
         value_fn=lambda data: data.get("ch2_water_temp_min"),
         scale_fn=unscale_temperature,
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaNumberEntityDescription(
         key="ch2_water_temp_max",
@@ -354,7 +354,7 @@ NUMBER_TYPES: tuple[JablotronVoltaNumberEntityDescription, ...] = (
         register=REG_CH2_TEMPER_WATER_MAX,
         value_fn=lambda data: data.get("ch2_water_temp_max"),
         scale_fn=unscale_temperature,
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaNumberEntityDescription(
         key="ch2_equitherm_slope",
@@ -366,7 +366,7 @@ NUMBER_TYPES: tuple[JablotronVoltaNumberEntityDescription, ...] = (
         register=REG_CH2_EQUITHERM_SLOPE,
         value_fn=lambda data: data.get("ch2_equitherm_slope"),
         scale_fn=unscale_ratio,
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaNumberEntityDescription(
         key="ch2_equitherm_offset",
@@ -379,7 +379,7 @@ NUMBER_TYPES: tuple[JablotronVoltaNumberEntityDescription, ...] = (
         register=REG_CH2_EQUITHERM_OFFSET,
         value_fn=lambda data: data.get("ch2_equitherm_offset"),
         scale_fn=unscale_signed_temperature,
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaNumberEntityDescription(
         key="ch2_equitherm_room_effect",
@@ -392,7 +392,7 @@ NUMBER_TYPES: tuple[JablotronVoltaNumberEntityDescription, ...] = (
         register=REG_CH2_EQUITHERM_ROOM_EFFECT,
         value_fn=lambda data: data.get("ch2_equitherm_room_effect"),
         scale_fn=lambda x: int(x),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaNumberEntityDescription(
         key="ch2_threshold_setpoint",
@@ -405,7 +405,7 @@ NUMBER_TYPES: tuple[JablotronVoltaNumberEntityDescription, ...] = (
         register=REG_CH2_THRESHOLD_SETPOINT,
         value_fn=lambda data: data.get("ch2_threshold_setpoint"),
         scale_fn=unscale_temperature,
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaNumberEntityDescription(
         key="ch2_limit_heat_temp",
@@ -418,7 +418,7 @@ NUMBER_TYPES: tuple[JablotronVoltaNumberEntityDescription, ...] = (
         register=REG_CH2_LIMIT_HEAT_TEMPER,
         value_fn=lambda data: data.get("ch2_limit_heat_temp"),
         scale_fn=unscale_temperature,
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaNumberEntityDescription(
         key="ch2_temp_correction",
@@ -431,7 +431,7 @@ NUMBER_TYPES: tuple[JablotronVoltaNumberEntityDescription, ...] = (
         register=REG_CH2_UI_SENSOR_CORR_TEMP_78,
         value_fn=lambda data: data.get("ch2_temp_correction"),
         scale_fn=unscale_signed_temperature,
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaNumberEntityDescription(
         key="ch2_humidity_correction",
@@ -444,10 +444,13 @@ NUMBER_TYPES: tuple[JablotronVoltaNumberEntityDescription, ...] = (
         register=REG_CH2_UI_SENSOR_CORR_HUMI_79,
         value_fn=lambda data: data.get("ch2_humidity_correction"),
         scale_fn=unscale_signed_percentage,
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
 )
 
+_BASE_NUMBERS = tuple(d for d in NUMBER_TYPES if d.available_fn is None)
+_CONDITIONAL_NUMBERS = tuple(d for d in NUMBER_TYPES if d.available_fn is not None)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -457,13 +460,15 @@ async def async_setup_entry(
     """Set up Jablotron Volta number entities."""
     coordinator: JablotronVoltaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[NumberEntity] = []
-
-    for description in NUMBER_TYPES:
-        if description.available_fn and not description.available_fn(coordinator):
-            continue
-
-        entities.append(JablotronVoltaNumber(coordinator, entry, description))
+    entities: list[NumberEntity] = [
+        JablotronVoltaNumber(coordinator, entry, description)
+        for description in _BASE_NUMBERS
+    ]
+    entities.extend(
+        JablotronVoltaNumber(coordinator, entry, description)
+        for description in _CONDITIONAL_NUMBERS
+        if description.available_fn(coordinator)
+    )
 
     async_add_entities(entities)
 
@@ -500,10 +505,8 @@ class JablotronVoltaNumber(CoordinatorEntity, NumberEntity):
 
         scaled_value = self.entity_description.scale_fn(value)
 
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.client.write_register,
-            self.entity_description.register,
-            scaled_value,
+        success = await self.coordinator.async_write_register(
+            self.entity_description.register, scaled_value
         )
 
         if success:
@@ -7,6 +7,8 @@ and human-readable values.
 
 from __future__ import annotations
 
+import socket
+import struct
 
 # ---------------------------------------------------------------------------
 # int16 helpers
@@ -21,9 +23,8 @@ def to_signed_int16(value: int) -> int:
 
     Example: 65516 (0xFFEC) -> -20
     """
-    if value > 32767:
-        return value - 65536
-    return value
+    # Branchless two's complement: flip the sign bit, then re-bias
+    return (value ^ 0x8000) - 0x8000
 
 
 def to_unsigned_int16(value: int) -> int:
@@ -137,7 +138,7 @@ def unscale_ratio(value: float) -> int:
 
 def registers_to_ip(reg0: int, reg1: int) -> str:
     """Convert two registers to IP address."""
-    return f"{reg0 >> 8}.{reg0 & 0xFF}.{reg1 >> 8}.{reg1 & 0xFF}"
+    return socket.inet_ntoa(struct.pack(">HH", reg0, reg1))
 
 
 def ip_to_registers(ip: str) -> tuple[int, int]:
@@ -150,11 +151,7 @@ def ip_to_registers(ip: str) -> tuple[int, int]:
 
 def registers_to_mac(reg0: int, reg1: int, reg2: int) -> str:
     """Convert three registers to MAC address."""
-    return (
-        f"{reg0 >> 8:02X}:{reg0 & 0xFF:02X}:"
-        f"{reg1 >> 8:02X}:{reg1 & 0xFF:02X}:"
-        f"{reg2 >> 8:02X}:{reg2 & 0xFF:02X}"
-    )
+    return struct.pack(">HHH", reg0, reg1, reg2).hex(":").upper()
 
 
 def registers_to_uint32(reg0: int, reg1: int) -> int:
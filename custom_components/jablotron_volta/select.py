@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -28,20 +28,56 @@ from .const import (
     REG_SYS_CONTROL,
     REG_SYS_MASTER_FAIL,
 )
-from .coordinator import JablotronVoltaCoordinator
+from .coordinator import JablotronVoltaCoordinator, is_ch2_available
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class _DenseOptions:
+    """Options map for dense integer keys 0..N-1 backed by a tuple."""
+
+    __slots__ = ("_options",)
+
+    def __init__(self, options: tuple[str, ...]) -> None:
+        """Initialize from options ordered by their register value."""
+        self._options = options
+
+    @classmethod
+    def from_mapping(cls, options_map: Mapping[int, str]) -> _DenseOptions:
+        """Build from a mapping whose keys are exactly 0..N-1."""
+        if sorted(options_map) != list(range(len(options_map))):
+            raise ValueError(f"Options map keys are not dense: {list(options_map)}")
+        return cls(tuple(options_map[key] for key in range(len(options_map))))
+
+    def get(self, value: int) -> str | None:
+        """Return the option for a register value, or None if out of range."""
+        if 0 <= value < len(self._options):
+            return self._options[value]
+        return None
+
+    def values(self) -> tuple[str, ...]:
+        """Return the options in register value order."""
+        return self._options
+
+    def items(self) -> Iterator[tuple[int, str]]:
+        """Return (register value, option) pairs."""
+        return enumerate(self._options)
+
+
 @dataclass(frozen=True)
 class JablotronVoltaSelectEntityDescription(SelectEntityDescription):
     """Describes Jablotron Volta select entity."""
 
     value_fn: Callable[[dict[str, Any]], int | None] | None = None
-    options_map: dict[int, str] | None = None
+    options_map: dict[int, str] | _DenseOptions | None = None
     register: int | None = None
     available_fn: Callable[[JablotronVoltaCoordinator], bool] | None = None
 
+    def __post_init__(self) -> None:
+        """Build the option list once from the options map."""
+        if self.options_map and self.options is None:
+            object.__setattr__(self, "options", list(self.options_map.values()))
+
 
 SELECT_TYPES: tuple[JablotronVoltaSelectEntityDescription, ...] = (
     JablotronVoltaSelectEntityDescription(
@@ -54,14 +90,14 @@ SELECT_TYPES: tuple[JablotronVoltaSelectEntityDescription, ...] = (
     JablotronVoltaSelectEntityDescription(
         key="outdoor_temp_source",
         translation_key="outdoor_temperature_source",
-        options_map=OUT_TEMP_SOURCE_MAP,
+        options_map=_DenseOptions.from_mapping(OUT_TEMP_SOURCE_MAP),
         register=REG_REGU_SOURCE_OUT_TEMPER,
         value_fn=lambda data: data.get("outdoor_temp_source"),
     ),
     JablotronVoltaSelectEntityDescription(
         key="dhw_regulation_strategy",
         translation_key="dhw_regulation_strategy",
-        options_map={0: "strategy_0", 1: "strategy_1", 2: "strategy_2"},
+        options_map=_DenseOptions(("strategy_0", "strategy_1", "strategy_2")),
         register=REG_DHW_REGULATION_STRAT,
         value_fn=lambda data: data.get("dhw_regulation_strategy"),
     ),
@@ -78,24 +114,27 @@ SELECT_TYPES: tuple[JablotronVoltaSelectEntityDescription, ...] = (
         options_map=REGULATION_STRAT_MAP,
         register=REG_CH2_REGULATION_STRAT,
         value_fn=lambda data: data.get("ch2_regulation_strategy"),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaSelectEntityDescription(
         key="control_mode",
         translation_key="control_mode",
-        options_map=CONTROL_MODE_MAP,
+        options_map=_DenseOptions.from_mapping(CONTROL_MODE_MAP),
         register=REG_SYS_CONTROL,
         value_fn=lambda data: data.get("control_mode"),
     ),
     JablotronVoltaSelectEntityDescription(
         key="master_fail_mode",
         translation_key="master_fail_mode",
-        options_map=MASTER_FAIL_MAP,
+        options_map=_DenseOptions.from_mapping(MASTER_FAIL_MAP),
         register=REG_SYS_MASTER_FAIL,
         value_fn=lambda data: data.get("master_fail_mode"),
     ),
 )
 
+_BASE_SELECTS = tuple(d for d in SELECT_TYPES if d.available_fn is None)
+_CONDITIONAL_SELECTS = tuple(d for d in SELECT_TYPES if d.available_fn is not None)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -105,13 +144,15 @@ async def async_setup_entry(
     """Set up Jablotron Volta select entities."""
     coordinator: JablotronVoltaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SelectEntity] = []
-
-    for description in SELECT_TYPES:
-        if description.available_fn and not description.available_fn(coordinator):
-            continue
-
-        entities.append(JablotronVoltaSelect(coordinator, entry, description))
+    entities: list[SelectEntity] = [
+        JablotronVoltaSelect(coordinator, entry, description)
+        for description in _BASE_SELECTS
+    ]
+    entities.extend(
+        JablotronVoltaSelect(coordinator, entry, description)
+        for description in _CONDITIONAL_SELECTS
+        if description.available_fn(coordinator)
+    )
 
     async_add_entities(entities)
 
@@ -134,10 +175,6 @@ class JablotronVoltaSelect(CoordinatorEntity, SelectEntity):
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = coordinator.device_info
 
-        # Set options from the map
-        if description.options_map:
-            self._attr_options = list(description.options_map.values())
-
     @property
     def current_option(self) -> str | None:
         """Return the selected option."""
@@ -168,10 +205,8 @@ class JablotronVoltaSelect(CoordinatorEntity, SelectEntity):
             )
             return
 
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.client.write_register,
-            self.entity_description.register,
-            value,
+        success = await self.coordinator.async_write_register(
+            self.entity_description.register, value
         )
 
         if success:
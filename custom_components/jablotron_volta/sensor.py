@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import logging
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -28,7 +28,7 @@ from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import JablotronVoltaCoordinator
+from .coordinator import JablotronVoltaCoordinator, is_ch2_available
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,9 +37,13 @@ _LOGGER = logging.getLogger(__name__)
 class JablotronVoltaSensorEntityDescription(SensorEntityDescription):
     """Describes Jablotron Volta sensor entity."""
 
-    value_fn: Callable[[dict[str, Any]], StateType] | None = None
+    data_key: str | None = None
     available_fn: Callable[[JablotronVoltaCoordinator], bool] | None = None
 
+    def __post_init__(self) -> None:
+        """Resolve and intern the coordinator data key."""
+        object.__setattr__(self, "data_key", sys.intern(self.data_key or self.key))
+
 
 SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
     # Energy - For Energy Dashboard
@@ -49,7 +53,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-        value_fn=lambda data: data.get("boiler_total_energy"),
     ),
     # System Temperatures
     JablotronVoltaSensorEntityDescription(
@@ -58,7 +61,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("cpu_temperature"),
     ),
     # Outdoor Temperatures
     JablotronVoltaSensorEntityDescription(
@@ -67,7 +69,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("outdoor_temp_damped"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="outdoor_temp_composite",
@@ -75,7 +76,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("outdoor_temp_composite"),
     ),
     # Room Temperatures (from thermostats)
     JablotronVoltaSensorEntityDescription(
@@ -84,7 +84,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("ch1_temperature_current"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="ch2_temperature_current",
@@ -92,8 +91,7 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("ch2_temperature_current"),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaSensorEntityDescription(
         key="dhw_temperature_current",
@@ -101,7 +99,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("dhw_temperature_current"),
     ),
     # Boiler Water Temperatures
     JablotronVoltaSensorEntityDescription(
@@ -110,7 +107,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("boiler_water_input_temp"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="boiler_water_return_temp",
@@ -118,7 +114,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("boiler_water_return_temp"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="boiler_water_setpoint",
@@ -126,7 +121,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("boiler_water_setpoint"),
     ),
     # CH1 Water Temperatures
     JablotronVoltaSensorEntityDescription(
@@ -135,7 +129,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("ch1_water_input_temp"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="ch1_water_return_temp",
@@ -143,7 +136,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("ch1_water_return_temp"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="ch1_water_setpoint",
@@ -151,7 +143,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("ch1_water_setpoint"),
     ),
     # CH2 Water Temperatures (conditional)
     JablotronVoltaSensorEntityDescription(
@@ -160,8 +151,7 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("ch2_water_input_temp"),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaSensorEntityDescription(
         key="ch2_water_return_temp",
@@ -169,8 +159,7 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("ch2_water_return_temp"),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaSensorEntityDescription(
         key="ch2_water_setpoint",
@@ -178,8 +167,7 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda data: data.get("ch2_water_setpoint"),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     # System Status
     JablotronVoltaSensorEntityDescription(
@@ -188,7 +176,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.VOLTAGE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-        value_fn=lambda data: data.get("battery_voltage"),
     ),
     # Boiler Status
     JablotronVoltaSensorEntityDescription(
@@ -197,38 +184,32 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfPressure.BAR,
-        value_fn=lambda data: data.get("boiler_pressure"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="boiler_pump_power",
         translation_key="boiler_pump_power",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: data.get("boiler_pump_power"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="boiler_heating_power",
         translation_key="boiler_heating_power",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: data.get("boiler_heating_power"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="boiler_pwm_value",
         translation_key="boiler_pwm_value",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: data.get("boiler_pwm_value"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="boiler_active_segments",
         translation_key="boiler_active_segments",
-        value_fn=lambda data: data.get("boiler_active_segments"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="boiler_inactive_segments",
         translation_key="boiler_inactive_segments",
-        value_fn=lambda data: data.get("boiler_inactive_segments"),
     ),
     # CH1 Environmental
     JablotronVoltaSensorEntityDescription(
@@ -237,7 +218,6 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: data.get("ch1_humidity"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="ch1_co2",
@@ -245,14 +225,12 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.CO2,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-        value_fn=lambda data: data.get("ch1_co2"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="ch1_pump_power",
         translation_key="ch1_pump_power",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: data.get("ch1_pump_power"),
     ),
     # CH2 Environmental (conditional)
     JablotronVoltaSensorEntityDescription(
@@ -261,8 +239,7 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: data.get("ch2_humidity"),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaSensorEntityDescription(
         key="ch2_co2",
@@ -270,35 +247,34 @@ SENSOR_TYPES: tuple[JablotronVoltaSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.CO2,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
-        value_fn=lambda data: data.get("ch2_co2"),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaSensorEntityDescription(
         key="ch2_pump_power",
         translation_key="ch2_pump_power",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda data: data.get("ch2_pump_power"),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     # Device Information
     JablotronVoltaSensorEntityDescription(
         key="ip_address",
         translation_key="ip_address",
-        value_fn=lambda data: data.get("ip_address"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="subnet_mask",
         translation_key="subnet_mask",
-        value_fn=lambda data: data.get("subnet_mask"),
     ),
     JablotronVoltaSensorEntityDescription(
         key="gateway",
         translation_key="gateway",
-        value_fn=lambda data: data.get("gateway"),
     ),
 )
 
+# Partitioned once at import so setup only evaluates conditional descriptions
+_BASE_SENSORS = tuple(d for d in SENSOR_TYPES if d.available_fn is None)
+_CONDITIONAL_SENSORS = tuple(d for d in SENSOR_TYPES if d.available_fn is not None)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -308,14 +284,15 @@ async def async_setup_entry(
     """Set up Jablotron Volta sensors."""
     coordinator: JablotronVoltaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SensorEntity] = []
-
-    for description in SENSOR_TYPES:
-        # Check if entity should be created based on availability function
-        if description.available_fn and not description.available_fn(coordinator):
-            continue
-
-        entities.append(JablotronVoltaSensor(coordinator, entry, description))
+    entities: list[SensorEntity] = [
+        JablotronVoltaSensor(coordinator, entry, description)
+        for description in _BASE_SENSORS
+    ]
+    entities.extend(
+        JablotronVoltaSensor(coordinator, entry, description)
+        for description in _CONDITIONAL_SENSORS
+        if description.available_fn(coordinator)
+    )
 
     async_add_entities(entities)
 
@@ -337,10 +314,9 @@ class JablotronVoltaSensor(CoordinatorEntity, SensorEntity):
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = coordinator.device_info
+        self._data_key = description.data_key
 
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
-        if self.entity_description.value_fn:
-            return self.entity_description.value_fn(self.coordinator.data)
-        return None
+        return self.coordinator.data.get(self._data_key)
@@ -20,7 +20,7 @@ from .const import (
     REG_CH2_FAST_COOLDOWN,
     REG_CH2_OPTIMAL_ON_OFF_ENABLE,
 )
-from .coordinator import JablotronVoltaCoordinator
+from .coordinator import JablotronVoltaCoordinator, is_ch2_available
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,8 +29,8 @@ _LOGGER = logging.getLogger(__name__)
 class JablotronVoltaSwitchEntityDescription(SwitchEntityDescription):
     """Describes Jablotron Volta switch entity."""
 
-    value_fn: Callable[[dict[str, Any]], bool] | None = None
     register: int | None = None
+    default_bool: bool = False
     available_fn: Callable[[JablotronVoltaCoordinator], bool] | None = None
 
 
@@ -39,30 +39,30 @@ SWITCH_TYPES: tuple[JablotronVoltaSwitchEntityDescription, ...] = (
         key="ch1_optimal_start",
         translation_key="ch1_optimal_start",
         register=REG_CH1_OPTIMAL_ON_OFF_ENABLE,
-        value_fn=lambda data: data.get("ch1_optimal_start", False),
     ),
     JablotronVoltaSwitchEntityDescription(
         key="ch1_fast_cooldown",
         translation_key="ch1_fast_cooldown",
         register=REG_CH1_FAST_COOLDOWN,
-        value_fn=lambda data: data.get("ch1_fast_cooldown", False),
     ),
     JablotronVoltaSwitchEntityDescription(
         key="ch2_optimal_start",
         translation_key="ch2_optimal_start",
         register=REG_CH2_OPTIMAL_ON_OFF_ENABLE,
-        value_fn=lambda data: data.get("ch2_optimal_start", False),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
     JablotronVoltaSwitchEntityDescription(
         key="ch2_fast_cooldown",
         translation_key="ch2_fast_cooldown",
         register=REG_CH2_FAST_COOLDOWN,
-        value_fn=lambda data: data.get("ch2_fast_cooldown", False),
-        available_fn=lambda coord: coord.ch2_available,
+        available_fn=is_ch2_available,
     ),
 )
 
+# CH2 switches are only created when the device reports the circuit
+_BASE_SWITCHES = tuple(d for d in SWITCH_TYPES if d.available_fn is None)
+_CONDITIONAL_SWITCHES = tuple(d for d in SWITCH_TYPES if d.available_fn is not None)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -72,13 +72,15 @@ async def async_setup_entry(
     """Set up Jablotron Volta switch entities."""
     coordinator: JablotronVoltaCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SwitchEntity] = []
-
-    for description in SWITCH_TYPES:
-        if description.available_fn and not description.available_fn(coordinator):
-            continue
-
-        entities.append(JablotronVoltaSwitch(coordinator, entry, description))
+    entities: list[SwitchEntity] = [
+        JablotronVoltaSwitch(coordinator, entry, description)
+        for description in _BASE_SWITCHES
+    ]
+    entities.extend(
+        JablotronVoltaSwitch(coordinator, entry, description)
+        for description in _CONDITIONAL_SWITCHES
+        if description.available_fn(coordinator)
+    )
 
     async_add_entities(entities)
 
@@ -100,42 +102,33 @@ class JablotronVoltaSwitch(CoordinatorEntity, SwitchEntity):
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = coordinator.device_info
+        self._key = description.key
+        self._register = description.register
+        self._default = description.default_bool
 
     @property
     def is_on(self) -> bool:
         """Return true if the switch is on."""
-        if self.entity_description.value_fn:
-            return self.entity_description.value_fn(self.coordinator.data)
-        return False
+        return self.coordinator.data.get(self._key, self._default)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        if not self.entity_description.register:
-            return
-
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.client.write_register,
-            self.entity_description.register,
-            1,
-        )
-
-        if success:
-            await self.coordinator.async_request_refresh()
-        else:
-            _LOGGER.error("Failed to turn on %s", self.entity_description.key)
+        await self._async_set(1)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        if not self.entity_description.register:
+        await self._async_set(0)
+
+    async def _async_set(self, value: int) -> None:
+        """Write the switch register and update state optimistically."""
+        if not self._register:
             return
 
-        success = await self.hass.async_add_executor_job(
-            self.coordinator.client.write_register,
-            self.entity_description.register,
-            0,
-        )
+        success = await self.coordinator.async_write_register(self._register, value)
 
         if success:
-            await self.coordinator.async_request_refresh()
+            # The next scheduled poll corrects any drift; no full refresh needed
+            self.coordinator.data[self._key] = bool(value)
+            self.async_write_ha_state()
         else:
-            _LOGGER.error("Failed to turn off %s", self.entity_description.key)
+            _LOGGER.error("Failed to turn %s %s", "on" if value else "off", self._key)
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -16,23 +21,36 @@ from custom_components.jablotron_volta.const import (
 )
 
 
+class _DummyClient:
+    """Minimal Modbus client stand-in: connects, reads zeros, accepts writes."""
+
+    __slots__ = ()
+
+    def connect(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        return None
+
+    def read_input_registers(self, *args: Any, **kwargs: Any) -> list[int]:
+        return [0] * 100
+
+    def read_holding_registers(self, *args: Any, **kwargs: Any) -> list[int]:
+        return [0] * 100
+
+    def write_register(self, *args: Any, **kwargs: Any) -> bool:
+        return True
+
+
 @pytest.fixture
 def mock_modbus_client():
     """Mock Modbus client."""
-    from custom_components.jablotron_volta.modbus_client import JablotronModbusClient
+    return _DummyClient()
 
-    client = MagicMock(spec=JablotronModbusClient)
-    client.connect = MagicMock(return_value=True)
-    client.close = MagicMock()
-    client.read_input_registers = MagicMock(return_value=[0] * 100)
-    client.read_holding_registers = MagicMock(return_value=[0] * 100)
-    client.write_register = MagicMock(return_value=True)
-    return client
 
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config_entry():
-    """Mock config entry."""
+    """Mock config entry, shared read-only across the whole session."""
     entry = MagicMock()
     entry.entry_id = "test_entry_id"
     entry.data = {
@@ -44,12 +62,10 @@ def mock_config_entry():
     return entry
 
 
-def _make_coordinator_data() -> dict:
-    """Build a realistic coordinator data dict with correct keys and values.
-
-    All values here are ALREADY SCALED (as produced by process_raw_data).
-    """
-    return {
+# Realistic coordinator data with correct keys and values, built once.
+# All values here are ALREADY SCALED (as produced by process_raw_data).
+_COORDINATOR_DATA: MappingProxyType[str, Any] = MappingProxyType(
+    {
         # System status
         "cpu_temperature": 45.5,
         "battery_voltage": 3.3,
@@ -135,30 +151,70 @@ def _make_coordinator_data() -> dict:
         "master_timeout": 60,
         "circuit_mask": 3,
     }
+)
+
+
+def _make_coordinator_data() -> dict:
+    """Return a mutable copy of the shared coordinator data snapshot."""
+    return dict(_COORDINATOR_DATA)
+
+
+@pytest.fixture(scope="session")
+def coordinator_data() -> MappingProxyType[str, Any]:
+    """Read-only coordinator data shared by the whole session."""
+    return _COORDINATOR_DATA
+
+
+@dataclass(slots=True)
+class _FakeCoordinator:
+    """Lightweight stand-in exposing only what entities use from the coordinator."""
+
+    data: dict[str, Any] = field(default_factory=_make_coordinator_data)
+    client: Any = None
+    ch2_available: bool = False
+    last_update_success: bool = True
+    device_info: dict[str, Any] = field(
+        default_factory=lambda: {
+            "identifiers": {(DOMAIN, "test_entry_id")},
+            "name": "Jablotron Volta",
+            "manufacturer": "Jablotron",
+            "model": "Volta",
+        }
+    )
+    async_request_refresh: AsyncMock = field(default_factory=AsyncMock)
+    async_write_register: AsyncMock = field(
+        default_factory=lambda: AsyncMock(return_value=True)
+    )
 
 
 @pytest.fixture
 def mock_coordinator(mock_modbus_client):
     """Mock coordinator with realistic data."""
-    from custom_components.jablotron_volta.coordinator import (
-        JablotronVoltaCoordinator,
-    )
-
-    coordinator = MagicMock(spec=JablotronVoltaCoordinator)
-    coordinator.data = _make_coordinator_data()
-    coordinator.ch2_available = False
-    coordinator.async_request_refresh = AsyncMock()
-    coordinator.client = mock_modbus_client
-    coordinator.device_info = {
-        "identifiers": {(DOMAIN, "test_entry_id")},
-        "name": "Jablotron Volta",
-        "manufacturer": "Jablotron",
-        "model": "Volta",
-    }
-    return coordinator
+    return _FakeCoordinator(client=mock_modbus_client)
 
 
 @pytest.fixture
 def hass():
     """Mock Home Assistant instance."""
     return MagicMock(spec=HomeAssistant)
+
+
+_TRANSLATIONS_DIR = Path("custom_components/jablotron_volta/translations")
+
+
+def _load_translations(lang: str) -> dict[str, Any]:
+    """Parse a translation file."""
+    with (_TRANSLATIONS_DIR / f"{lang}.json").open() as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def en_translations() -> dict[str, Any]:
+    """Parsed en.json translations, loaded once per session (read-only)."""
+    return _load_translations("en")
+
+
+@pytest.fixture(scope="session")
+def cs_translations() -> dict[str, Any]:
+    """Parsed cs.json translations, loaded once per session (read-only)."""
+    return _load_translations("cs")
@@ -1,14 +1,26 @@
-"""Tests for coordinator parse functions.
+"""Tests for coordinator parse functions and the coordinator class.
 
-These tests call the REAL pure parse functions from coordinator.py
+The parse tests call the REAL pure parse functions from coordinator.py
 with realistic register data and verify the output dictionaries.
-No mocking needed — these are pure functions.
+No mocking needed — these are pure functions. The coordinator class tests
+at the end drive a real coordinator with a stub client and executor.
 """
 
 from __future__ import annotations
 
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.jablotron_volta import coordinator as coordinator_module
 from custom_components.jablotron_volta.coordinator import (
+    JablotronVoltaCoordinator,
     parse_boiler_settings,
     parse_boiler_status,
     parse_ch_settings,
@@ -159,6 +171,15 @@ class TestParseChStatus:
     def test_too_short(self):
         assert parse_ch_status([1, 2], "ch1") == {}
 
+    def test_keys_are_interned(self):
+        result = parse_ch_status([0] * 7, "ch2")
+
+        assert all(key is sys.intern(key) for key in result)
+
+    def test_unknown_prefix(self):
+        with pytest.raises(ValueError, match="'ch3'"):
+            parse_ch_status([0] * 7, "ch3")
+
 
 class TestParseSystemAlerts:
     """Test parse_system_alerts."""
@@ -295,6 +316,10 @@ class TestParseChSettings:
     def test_too_short(self):
         assert parse_ch_settings([1, 2, 3], "ch1") == {}
 
+    def test_unknown_prefix(self):
+        with pytest.raises(ValueError, match="'ch3'"):
+            parse_ch_settings([0] * 20, "ch3")
+
 
 class TestParseSystemControl:
     """Test parse_system_control."""
@@ -400,3 +425,156 @@ class TestProcessRawData:
         raw = {"system_status": [455, 33]}
         result = process_raw_data(raw)
         assert "ch2_state_heat" not in result
+
+
+# ---------------------------------------------------------------------------
+# Coordinator class
+# ---------------------------------------------------------------------------
+
+
+def _make_coordinator(entry, client) -> JablotronVoltaCoordinator:
+    """Build a real coordinator around a stub client and a mocked hass."""
+    return JablotronVoltaCoordinator(MagicMock(spec=HomeAssistant), entry, client)
+
+
+class _PollClient:
+    """Connects and returns a fresh, equal raw register snapshot per poll."""
+
+    def connect(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        return None
+
+    def read_all_data(self) -> dict[str, Any]:
+        return {
+            "system_status": [455, 33],
+            "ch1_settings": [2] + [0] * 15 + [1, 0, 0, 0],
+            "ch2_available": False,
+        }
+
+
+class TestFetchDataPollCache:
+    """Test reuse of processed data when raw registers are unchanged."""
+
+    def test_unchanged_registers_skip_parsing(self, mock_config_entry):
+        coordinator = _make_coordinator(mock_config_entry, _PollClient())
+
+        with patch.object(
+            coordinator_module,
+            "process_raw_data",
+            wraps=coordinator_module.process_raw_data,
+        ) as process:
+            first = coordinator._fetch_data()
+            second = coordinator._fetch_data()
+
+        assert process.call_count == 1
+        assert first == second
+        assert first is not second
+
+    def test_mutating_a_result_does_not_leak_into_the_cache(self, mock_config_entry):
+        coordinator = _make_coordinator(mock_config_entry, _PollClient())
+
+        # Parse on the first poll, cache hits after; each result is then
+        # mutated like an optimistic switch update on coordinator.data
+        for _ in range(3):
+            result = coordinator._fetch_data()
+            assert result["ch1_optimal_start"] is True
+            assert result["cpu_temperature"] == 45.5
+            result["ch1_optimal_start"] = False
+            result["cpu_temperature"] = 0.0
+
+
+_DEVICE_META = {
+    "serial_number": "SN123",
+    "firmware_version": "1.2.3",
+    "hardware_version": "4.5",
+    "mac_address": "AA:BB:CC:DD:EE:FF",
+}
+
+
+class TestDeviceInfoCache:
+    """device_info is rebuilt only when the device metadata changes."""
+
+    @pytest.fixture
+    def coordinator(self, mock_config_entry):
+        coordinator = _make_coordinator(mock_config_entry, _PollClient())
+        coordinator._update_device_meta(dict(_DEVICE_META))
+        return coordinator
+
+    def test_same_dict_until_meta_changes(self, coordinator):
+        first = coordinator.device_info
+        assert first["serial_number"] == "SN123"
+        assert first["sw_version"] == "1.2.3"
+
+        coordinator._update_device_meta(dict(_DEVICE_META))
+        assert coordinator.device_info is first
+
+    @pytest.mark.parametrize("field", sorted(_DEVICE_META))
+    def test_new_dict_after_change(self, coordinator, field):
+        first = coordinator.device_info
+
+        coordinator._update_device_meta({**_DEVICE_META, field: "changed"})
+        second = coordinator.device_info
+
+        assert second is not first
+        assert coordinator.device_info is second
+
+
+class _SlowPollClient(_PollClient):
+    """Poll client that blocks in read_all_data and logs every client call."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.reading = threading.Event()
+        self.release = threading.Event()
+
+    def connect(self) -> bool:
+        self.calls.append("connect")
+        return True
+
+    def close(self) -> None:
+        self.calls.append("close")
+
+    def read_all_data(self) -> dict[str, Any]:
+        self.calls.append("read")
+        self.reading.set()
+        self.release.wait(5)
+        return super().read_all_data()
+
+    def write_register(self, address: int, value: int) -> bool:
+        self.calls.append(f"write {address}={value}")
+        return True
+
+
+class TestRegisterWrites:
+    """Register writes share the client lock with polls."""
+
+    @pytest.mark.asyncio
+    async def test_write_returns_client_result(self, mock_config_entry):
+        client = _SlowPollClient()
+        coordinator = _make_coordinator(mock_config_entry, client)
+        coordinator.hass.async_add_executor_job = AsyncMock(
+            side_effect=lambda func, *args: func(*args)
+        )
+
+        assert await coordinator.async_write_register(2000, 1) is True
+        assert client.calls == ["write 2000=1"]
+
+    def test_write_waits_for_running_poll(self, mock_config_entry):
+        client = _SlowPollClient()
+        coordinator = _make_coordinator(mock_config_entry, client)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            poll = pool.submit(coordinator._fetch_data)
+            assert client.reading.wait(5)
+            write = pool.submit(coordinator._write_register, 2000, 1)
+            # Long enough for an unserialized write to reach the client
+            time.sleep(0.05)
+            assert not write.done()
+
+            client.release.set()
+            poll.result(5)
+            assert write.result(5) is True
+
+        assert client.calls == ["connect", "read", "close", "write 2000=1"]
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 import pytest
 
 from custom_components.jablotron_volta.number import (
+    _BASE_NUMBERS,
+    _CONDITIONAL_NUMBERS,
     NUMBER_TYPES,
     JablotronVoltaNumber,
 )
@@ -15,7 +22,58 @@ from custom_components.jablotron_volta.scaling import (
     unscale_temperature,
 )
 
-from .conftest import _make_coordinator_data
+# Descriptor lookups shared by the tests below, built once at import
+_NUMBERS_BY_KEY = {n.key: n for n in NUMBER_TYPES}
+_CH2_NUMBERS = tuple(n for n in NUMBER_TYPES if "ch2" in n.key)
+_NON_CH2_NUMBERS = tuple(n for n in NUMBER_TYPES if "ch2" not in n.key)
+_EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+
+# Number keys grouped by the scaling their scale_fn applies
+_UNSIGNED_TEMP_KEYS = (
+    "boiler_water_temp_max",
+    "boiler_water_temp_min",
+    "dhw_hysteresis",
+    "ch1_antifrost_temp",
+    "ch1_hysteresis",
+    "ch1_water_temp_min",
+    "ch1_water_temp_max",
+    "ch1_threshold_setpoint",
+    "ch1_limit_heat_temp",
+)
+_UNSIGNED_TEMP_CASES = ((55.0, 550), (0.0, 0))
+_SIGNED_TEMP_KEYS = (
+    "changeover_temp",
+    "outdoor_temp_manual",
+    "boiler_outdoor_temp_correction",
+    "ch1_equitherm_offset",
+    "ch1_temp_correction",
+)
+_RATIO_KEYS = ("composite_filter_ratio", "ch1_equitherm_slope")
+_INT_KEYS = ("building_momentum", "ch1_equitherm_room_effect")
+
+# CH1/CH2 number pairs that must scale identically, and the values checked
+_CH_PAIRS = (
+    ("ch1_antifrost_temp", "ch2_antifrost_temp"),
+    ("ch1_hysteresis", "ch2_hysteresis"),
+    ("ch1_water_temp_min", "ch2_water_temp_min"),
+    ("ch1_water_temp_max", "ch2_water_temp_max"),
+    ("ch1_equitherm_slope", "ch2_equitherm_slope"),
+    ("ch1_equitherm_offset", "ch2_equitherm_offset"),
+    ("ch1_equitherm_room_effect", "ch2_equitherm_room_effect"),
+    ("ch1_threshold_setpoint", "ch2_threshold_setpoint"),
+    ("ch1_limit_heat_temp", "ch2_limit_heat_temp"),
+    ("ch1_temp_correction", "ch2_temp_correction"),
+    ("ch1_humidity_correction", "ch2_humidity_correction"),
+)
+_CH_TEST_VALUES = (0.0, 1.0, -2.5, 50.0)
+# (ch1_key, ch2_key, value) limited to values within the CH1 minimum
+_CH_PAIR_CASES = tuple(
+    (ch1_key, ch2_key, val)
+    for ch1_key, ch2_key in _CH_PAIRS
+    for val in _CH_TEST_VALUES
+    if _NUMBERS_BY_KEY[ch1_key].native_min_value is None
+    or val >= _NUMBERS_BY_KEY[ch1_key].native_min_value
+)
 
 
 # ---------------------------------------------------------------------------
@@ -26,23 +84,20 @@ from .conftest import _make_coordinator_data
 def test_all_numbers_have_translation_key():
     """Test that all number descriptions have translation_key."""
     for number in NUMBER_TYPES:
-        assert hasattr(number, "translation_key"), (
-            f"Number {number.key} missing translation_key"
+        assert number.translation_key, (
+            f"Number {number.key} has empty/missing translation_key"
         )
-        assert number.translation_key, f"Number {number.key} has empty translation_key"
 
 
 def test_all_numbers_have_register():
     """Test that all number descriptions have register address."""
     for number in NUMBER_TYPES:
-        assert hasattr(number, "register"), f"Number {number.key} missing register"
         assert number.register is not None, f"Number {number.key} has None register"
 
 
 def test_all_numbers_have_scale_fn():
     """Test that all number descriptions have scale_fn for writing."""
     for number in NUMBER_TYPES:
-        assert hasattr(number, "scale_fn"), f"Number {number.key} missing scale_fn"
         assert number.scale_fn is not None, f"Number {number.key} has None scale_fn"
 
 
@@ -63,42 +118,45 @@ def test_all_numbers_have_valid_range():
 
 def test_no_duplicate_number_keys():
     """Test that there are no duplicate number keys."""
-    keys = [n.key for n in NUMBER_TYPES]
-    duplicates = [k for k in keys if keys.count(k) > 1]
-    assert not duplicates, f"Found duplicate number keys: {set(duplicates)}"
+    counts = Counter(n.key for n in NUMBER_TYPES)
+    duplicates = {k for k, c in counts.items() if c > 1}
+    assert not duplicates, f"Found duplicate number keys: {duplicates}"
 
 
 def test_no_duplicate_translation_keys():
     """Test that there are no duplicate translation keys."""
-    translation_keys = [n.translation_key for n in NUMBER_TYPES]
-    duplicates = [k for k in translation_keys if translation_keys.count(k) > 1]
-    assert not duplicates, f"Found duplicate translation keys: {set(duplicates)}"
+    counts = Counter(n.translation_key for n in NUMBER_TYPES)
+    duplicates = {k for k, c in counts.items() if c > 1}
+    assert not duplicates, f"Found duplicate translation keys: {duplicates}"
 
 
 def test_no_duplicate_registers():
     """Test that there are no duplicate register addresses."""
-    registers = [n.register for n in NUMBER_TYPES]
-    duplicates = [r for r in registers if registers.count(r) > 1]
-    assert not duplicates, f"Found duplicate register addresses: {set(duplicates)}"
+    counts = Counter(n.register for n in NUMBER_TYPES)
+    duplicates = {r for r, c in counts.items() if c > 1}
+    assert not duplicates, f"Found duplicate register addresses: {duplicates}"
 
 
 def test_translation_keys_use_full_words():
     """Test that translation_keys don't use 'temp' abbreviation."""
-    for number in NUMBER_TYPES:
-        tk = number.translation_key
-        if tk and "temp" in tk and "temperature" not in tk:
-            pytest.fail(
-                f"Number {number.key}: translation_key '{tk}' uses abbreviation "
-                "'temp' — use 'temperature' instead"
-            )
+    violators = [
+        (n.key, n.translation_key)
+        for n in NUMBER_TYPES
+        if n.translation_key
+        and "temp" in n.translation_key
+        and "temperature" not in n.translation_key
+    ]
+    assert not violators, (
+        f"translation_keys use abbreviation 'temp' — use 'temperature' "
+        f"instead: {violators}"
+    )
 
 
 def test_ch2_numbers_have_available_fn():
     """Test that CH2 numbers have availability function."""
-    ch2_numbers = [n for n in NUMBER_TYPES if "ch2" in n.key]
-    assert len(ch2_numbers) > 0, "No CH2 numbers found"
+    assert len(_CH2_NUMBERS) > 0, "No CH2 numbers found"
 
-    for number in ch2_numbers:
+    for number in _CH2_NUMBERS:
         assert number.available_fn is not None, (
             f"CH2 number {number.key} should have available_fn"
         )
@@ -106,186 +164,137 @@ def test_ch2_numbers_have_available_fn():
 
 def test_non_ch2_numbers_lack_available_fn():
     """Non-CH2 numbers should NOT have available_fn."""
-    non_ch2_numbers = [n for n in NUMBER_TYPES if "ch2" not in n.key]
-    for number in non_ch2_numbers:
+    for number in _NON_CH2_NUMBERS:
         assert number.available_fn is None, (
             f"Non-CH2 number {number.key} should not have available_fn"
         )
 
 
+def test_number_partition_matches_ch2_split():
+    """Setup partitions put exactly the CH2 numbers in the conditional tuple."""
+    assert _CONDITIONAL_NUMBERS == _CH2_NUMBERS
+    assert _BASE_NUMBERS == _NON_CH2_NUMBERS
+
+
 # ---------------------------------------------------------------------------
 # value_fn tests — verify each number reads correct key from coordinator data
 # ---------------------------------------------------------------------------
 
 
-class TestNumberValueFunctions:
+VALUE_FN_CASES = [
+    # Regulation
+    ("building_momentum", 48),
+    ("composite_filter_ratio", 0.5),
+    ("changeover_temp", 5.0),
+    ("outdoor_temp_manual", -5.0),
+    # Boiler
+    ("boiler_outdoor_temp_correction", 0.0),
+    ("boiler_water_temp_max", 80.0),
+    ("boiler_water_temp_min", 30.0),
+    # DHW
+    ("dhw_hysteresis", 2.0),
+    # CH1
+    ("ch1_antifrost_temp", 8.0),
+    ("ch1_hysteresis", 1.0),
+    ("ch1_water_temp_min", 25.0),
+    ("ch1_water_temp_max", 55.0),
+    ("ch1_equitherm_slope", 1.5),
+    ("ch1_equitherm_offset", -2.0),
+    ("ch1_equitherm_room_effect", 50),
+    ("ch1_threshold_setpoint", 45.0),
+    ("ch1_limit_heat_temp", 3.0),
+    ("ch1_temp_correction", -0.5),
+    ("ch1_humidity_correction", 0.0),
+]
+
+
+@pytest.mark.parametrize(("key", "expected"), VALUE_FN_CASES)
+def test_value_fn(key, expected, coordinator_data):
     """Test that each number's value_fn extracts the correct value from data."""
+    got = _NUMBERS_BY_KEY[key].value_fn(coordinator_data)
+    assert got == expected, f"Number {key} expected {expected}, got {got}"
 
-    @pytest.fixture(autouse=True)
-    def setup_data(self):
-        self.data = _make_coordinator_data()
-
-    def _get_number(self, key: str):
-        for n in NUMBER_TYPES:
-            if n.key == key:
-                return n
-        pytest.fail(f"Number with key '{key}' not found in NUMBER_TYPES")
-
-    # --- Regulation ---
-    def test_building_momentum(self):
-        n = self._get_number("building_momentum")
-        assert n.value_fn(self.data) == 48
-
-    def test_composite_filter_ratio(self):
-        n = self._get_number("composite_filter_ratio")
-        assert n.value_fn(self.data) == 0.5
-
-    def test_changeover_temp(self):
-        n = self._get_number("changeover_temp")
-        assert n.value_fn(self.data) == 5.0
-
-    def test_outdoor_temp_manual(self):
-        n = self._get_number("outdoor_temp_manual")
-        assert n.value_fn(self.data) == -5.0
-
-    # --- Boiler ---
-    def test_boiler_outdoor_temp_correction(self):
-        n = self._get_number("boiler_outdoor_temp_correction")
-        assert n.value_fn(self.data) == 0.0
-
-    def test_boiler_water_temp_max(self):
-        n = self._get_number("boiler_water_temp_max")
-        assert n.value_fn(self.data) == 80.0
-
-    def test_boiler_water_temp_min(self):
-        n = self._get_number("boiler_water_temp_min")
-        assert n.value_fn(self.data) == 30.0
-
-    # --- DHW ---
-    def test_dhw_hysteresis(self):
-        n = self._get_number("dhw_hysteresis")
-        assert n.value_fn(self.data) == 2.0
-
-    # --- CH1 ---
-    def test_ch1_antifrost_temp(self):
-        n = self._get_number("ch1_antifrost_temp")
-        assert n.value_fn(self.data) == 8.0
-
-    def test_ch1_hysteresis(self):
-        n = self._get_number("ch1_hysteresis")
-        assert n.value_fn(self.data) == 1.0
-
-    def test_ch1_water_temp_min(self):
-        n = self._get_number("ch1_water_temp_min")
-        assert n.value_fn(self.data) == 25.0
-
-    def test_ch1_water_temp_max(self):
-        n = self._get_number("ch1_water_temp_max")
-        assert n.value_fn(self.data) == 55.0
-
-    def test_ch1_equitherm_slope(self):
-        n = self._get_number("ch1_equitherm_slope")
-        assert n.value_fn(self.data) == 1.5
-
-    def test_ch1_equitherm_offset(self):
-        n = self._get_number("ch1_equitherm_offset")
-        assert n.value_fn(self.data) == -2.0
-
-    def test_ch1_equitherm_room_effect(self):
-        n = self._get_number("ch1_equitherm_room_effect")
-        assert n.value_fn(self.data) == 50
-
-    def test_ch1_threshold_setpoint(self):
-        n = self._get_number("ch1_threshold_setpoint")
-        assert n.value_fn(self.data) == 45.0
-
-    def test_ch1_limit_heat_temp(self):
-        n = self._get_number("ch1_limit_heat_temp")
-        assert n.value_fn(self.data) == 3.0
-
-    def test_ch1_temp_correction(self):
-        n = self._get_number("ch1_temp_correction")
-        assert n.value_fn(self.data) == -0.5
-
-    def test_ch1_humidity_correction(self):
-        n = self._get_number("ch1_humidity_correction")
-        assert n.value_fn(self.data) == 0.0
-
-    # --- CH2 (returns None — no CH2 data in base fixture) ---
-    def test_ch2_numbers_return_none_without_data(self):
-        """All CH2 numbers should return None when CH2 data is absent."""
-        ch2_numbers = [n for n in NUMBER_TYPES if "ch2" in n.key]
-        for number in ch2_numbers:
-            result = number.value_fn(self.data)
-            assert result is None, (
-                f"CH2 number {number.key} returned {result}, expected None"
-            )
+
+def test_ch2_numbers_return_none_without_data(coordinator_data):
+    """All CH2 numbers should return None when CH2 data is absent."""
+    for number in _CH2_NUMBERS:
+        result = number.value_fn(coordinator_data)
+        assert result is None, (
+            f"CH2 number {number.key} returned {result}, expected None"
+        )
+
+
+# CH2 settings injected on top of the base data, and the values numbers read
+_CH2_DATA_PATCH = {
+    "ch2_temperature_antifrost": 7.0,
+    "ch2_hysteresis": 1.5,
+    "ch2_water_temp_min": 20.0,
+    "ch2_water_temp_max": 60.0,
+    "ch2_equitherm_slope": 1.2,
+    "ch2_equitherm_offset": -1.0,
+    "ch2_equitherm_room_effect": 40,
+    "ch2_threshold_setpoint": 50.0,
+    "ch2_limit_heat_temp": 4.0,
+    "ch2_temp_correction": 0.5,
+    "ch2_humidity_correction": -5.0,
+}
+
+_CH2_EXPECTED = [
+    ("ch2_antifrost_temp", 7.0),
+    ("ch2_hysteresis", 1.5),
+    ("ch2_water_temp_min", 20.0),
+    ("ch2_water_temp_max", 60.0),
+    ("ch2_equitherm_slope", 1.2),
+    ("ch2_equitherm_offset", -1.0),
+    ("ch2_equitherm_room_effect", 40),
+    ("ch2_threshold_setpoint", 50.0),
+    ("ch2_limit_heat_temp", 4.0),
+    ("ch2_temp_correction", 0.5),
+    ("ch2_humidity_correction", -5.0),
+]
+
+
+@pytest.fixture(scope="module")
+def ch2_data(coordinator_data):
+    """Base coordinator data plus CH2 settings, built once per module."""
+    data = dict(coordinator_data)
+    data.update(_CH2_DATA_PATCH)
+    return data
 
 
 class TestNumberValueFnWithCh2Data:
     """Test CH2 number value_fn when CH2 data is present."""
 
-    def test_ch2_numbers_return_values_when_present(self):
-        data = _make_coordinator_data()
-        data.update(
-            {
-                "ch2_temperature_antifrost": 7.0,
-                "ch2_hysteresis": 1.5,
-                "ch2_water_temp_min": 20.0,
-                "ch2_water_temp_max": 60.0,
-                "ch2_equitherm_slope": 1.2,
-                "ch2_equitherm_offset": -1.0,
-                "ch2_equitherm_room_effect": 40,
-                "ch2_threshold_setpoint": 50.0,
-                "ch2_limit_heat_temp": 4.0,
-                "ch2_temp_correction": 0.5,
-                "ch2_humidity_correction": -5.0,
-            }
-        )
-
-        expected = {
-            "ch2_antifrost_temp": 7.0,
-            "ch2_hysteresis": 1.5,
-            "ch2_water_temp_min": 20.0,
-            "ch2_water_temp_max": 60.0,
-            "ch2_equitherm_slope": 1.2,
-            "ch2_equitherm_offset": -1.0,
-            "ch2_equitherm_room_effect": 40,
-            "ch2_threshold_setpoint": 50.0,
-            "ch2_limit_heat_temp": 4.0,
-            "ch2_temp_correction": 0.5,
-            "ch2_humidity_correction": -5.0,
-        }
-
-        for key, exp_val in expected.items():
-            number = next(n for n in NUMBER_TYPES if n.key == key)
-            assert number.value_fn(data) == exp_val, (
-                f"Number {key} expected {exp_val}, got {number.value_fn(data)}"
-            )
+    @pytest.mark.parametrize(("key", "expected"), _CH2_EXPECTED)
+    def test_ch2_numbers_return_values_when_present(self, key, expected, ch2_data):
+        got = _NUMBERS_BY_KEY[key].value_fn(ch2_data)
+        assert got == expected, f"Number {key} expected {expected}, got {got}"
 
 
 class TestNumberValueFnEdgeCases:
     """Test value_fn behavior with empty data."""
 
     def test_all_value_fns_return_none_for_empty_data(self):
-        empty_data: dict = {}
-        for number in NUMBER_TYPES:
-            result = number.value_fn(empty_data)
-            assert result is None, (
-                f"Number {number.key} returned {result} for empty data, expected None"
-            )
+        offenders = [
+            number.key
+            for number in NUMBER_TYPES
+            if number.value_fn(_EMPTY_DATA) is not None
+        ]
+        assert not offenders, (
+            f"Numbers returned a value for empty data, expected None: {offenders}"
+        )
 
-    def test_value_fn_completeness(self):
+    def test_value_fn_completeness(self, coordinator_data):
         """Every non-CH2 number should return a value from conftest data."""
-        data = _make_coordinator_data()
-        for number in NUMBER_TYPES:
-            if "ch2" in number.key:
-                continue
-            result = number.value_fn(data)
-            assert result is not None, (
-                f"Number {number.key} returned None — data key may be missing "
-                f"from _make_coordinator_data()"
-            )
+        missing = [
+            number.key
+            for number in _NON_CH2_NUMBERS
+            if number.value_fn(coordinator_data) is None
+        ]
+        assert not missing, (
+            f"Numbers returned None — data keys may be missing "
+            f"from _COORDINATOR_DATA: {missing}"
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -296,121 +305,72 @@ class TestNumberValueFnEdgeCases:
 class TestNumberScaleFunctions:
     """Test that each number's scale_fn produces the correct register value."""
 
-    def _get_number(self, key: str):
-        for n in NUMBER_TYPES:
-            if n.key == key:
-                return n
-        pytest.fail(f"Number with key '{key}' not found in NUMBER_TYPES")
-
     # --- Unsigned temperatures (unscale_temperature: value * 10) ---
-    def test_scale_fn_unsigned_temperature(self):
+    @pytest.mark.parametrize("key", _UNSIGNED_TEMP_KEYS)
+    def test_scale_fn_unsigned_temperature(self, key):
         """Unsigned temp numbers: 55.0 -> 550."""
-        unsigned_temp_keys = [
-            "boiler_water_temp_max",
-            "boiler_water_temp_min",
-            "dhw_hysteresis",
-            "ch1_antifrost_temp",
-            "ch1_hysteresis",
-            "ch1_water_temp_min",
-            "ch1_water_temp_max",
-            "ch1_threshold_setpoint",
-            "ch1_limit_heat_temp",
-        ]
-        for key in unsigned_temp_keys:
-            n = self._get_number(key)
-            assert n.scale_fn(55.0) == 550, f"{key}: scale_fn(55.0) should be 550"
-            assert n.scale_fn(0.0) == 0, f"{key}: scale_fn(0.0) should be 0"
+        scale_fn = _NUMBERS_BY_KEY[key].scale_fn
+        for value, expected in _UNSIGNED_TEMP_CASES:
+            assert scale_fn(value) == expected, (
+                f"{key}: scale_fn({value}) should be {expected}"
+            )
 
     # --- Signed temperatures (unscale_signed_temperature) ---
-    def test_scale_fn_signed_temperature_positive(self):
+    @pytest.mark.parametrize("key", _SIGNED_TEMP_KEYS)
+    def test_scale_fn_signed_temperature_positive(self, key):
         """Positive signed temp: 5.0 -> 50."""
-        signed_temp_keys = [
-            "changeover_temp",
-            "outdoor_temp_manual",
-            "boiler_outdoor_temp_correction",
-            "ch1_equitherm_offset",
-            "ch1_temp_correction",
-        ]
-        for key in signed_temp_keys:
-            n = self._get_number(key)
-            assert n.scale_fn(5.0) == 50, f"{key}: scale_fn(5.0) should be 50"
+        n = _NUMBERS_BY_KEY[key]
+        assert n.scale_fn(5.0) == 50, f"{key}: scale_fn(5.0) should be 50"
 
-    def test_scale_fn_signed_temperature_negative(self):
+    @pytest.mark.parametrize("key", _SIGNED_TEMP_KEYS)
+    def test_scale_fn_signed_temperature_negative(self, key):
         """Negative signed temp: -2.0 -> 65516 (two's complement)."""
-        signed_temp_keys = [
-            "changeover_temp",
-            "outdoor_temp_manual",
-            "boiler_outdoor_temp_correction",
-            "ch1_equitherm_offset",
-            "ch1_temp_correction",
-        ]
-        for key in signed_temp_keys:
-            n = self._get_number(key)
-            assert n.scale_fn(-2.0) == 65516, (
-                f"{key}: scale_fn(-2.0) should be 65516 (two's complement)"
-            )
+        n = _NUMBERS_BY_KEY[key]
+        assert n.scale_fn(-2.0) == 65516, (
+            f"{key}: scale_fn(-2.0) should be 65516 (two's complement)"
+        )
 
     def test_scale_fn_signed_temperature_zero(self):
         """Zero signed temp: 0.0 -> 0."""
-        n = self._get_number("changeover_temp")
+        n = _NUMBERS_BY_KEY["changeover_temp"]
         assert n.scale_fn(0.0) == 0
 
     # --- Ratio (unscale_ratio: value * 10) ---
-    def test_scale_fn_ratio(self):
+    @pytest.mark.parametrize("key", _RATIO_KEYS)
+    def test_scale_fn_ratio(self, key):
         """Ratio numbers: 1.5 -> 15."""
-        ratio_keys = ["composite_filter_ratio", "ch1_equitherm_slope"]
-        for key in ratio_keys:
-            n = self._get_number(key)
-            assert n.scale_fn(1.5) == 15, f"{key}: scale_fn(1.5) should be 15"
-            assert n.scale_fn(0.0) == 0, f"{key}: scale_fn(0.0) should be 0"
+        n = _NUMBERS_BY_KEY[key]
+        assert n.scale_fn(1.5) == 15, f"{key}: scale_fn(1.5) should be 15"
+        assert n.scale_fn(0.0) == 0, f"{key}: scale_fn(0.0) should be 0"
 
     # --- Signed percentage (unscale_signed_percentage) ---
     def test_scale_fn_signed_percentage_positive(self):
         """Positive signed %: 5.0 -> 50."""
-        n = self._get_number("ch1_humidity_correction")
+        n = _NUMBERS_BY_KEY["ch1_humidity_correction"]
         assert n.scale_fn(5.0) == 50
 
     def test_scale_fn_signed_percentage_negative(self):
         """Negative signed %: -5.0 -> 65486 (two's complement)."""
-        n = self._get_number("ch1_humidity_correction")
+        n = _NUMBERS_BY_KEY["ch1_humidity_correction"]
         assert n.scale_fn(-5.0) == 65486
 
     # --- Integer passthrough (lambda x: int(x)) ---
-    def test_scale_fn_integer_passthrough(self):
+    @pytest.mark.parametrize("key", _INT_KEYS)
+    def test_scale_fn_integer_passthrough(self, key):
         """Integer passthrough numbers: 48 -> 48."""
-        int_keys = ["building_momentum", "ch1_equitherm_room_effect"]
-        for key in int_keys:
-            n = self._get_number(key)
-            assert n.scale_fn(48.0) == 48, f"{key}: scale_fn(48.0) should be 48"
-            assert n.scale_fn(0.0) == 0, f"{key}: scale_fn(0.0) should be 0"
+        n = _NUMBERS_BY_KEY[key]
+        assert n.scale_fn(48.0) == 48, f"{key}: scale_fn(48.0) should be 48"
+        assert n.scale_fn(0.0) == 0, f"{key}: scale_fn(0.0) should be 0"
 
     # --- CH2 scale_fn ---
-    def test_ch2_scale_fns_match_ch1(self):
+    @pytest.mark.parametrize(("ch1_key", "ch2_key", "val"), _CH_PAIR_CASES)
+    def test_ch2_scale_fns_match_ch1(self, ch1_key, ch2_key, val):
         """CH2 scale_fn should produce same results as CH1 equivalents."""
-        pairs = [
-            ("ch1_antifrost_temp", "ch2_antifrost_temp"),
-            ("ch1_hysteresis", "ch2_hysteresis"),
-            ("ch1_water_temp_min", "ch2_water_temp_min"),
-            ("ch1_water_temp_max", "ch2_water_temp_max"),
-            ("ch1_equitherm_slope", "ch2_equitherm_slope"),
-            ("ch1_equitherm_offset", "ch2_equitherm_offset"),
-            ("ch1_equitherm_room_effect", "ch2_equitherm_room_effect"),
-            ("ch1_threshold_setpoint", "ch2_threshold_setpoint"),
-            ("ch1_limit_heat_temp", "ch2_limit_heat_temp"),
-            ("ch1_temp_correction", "ch2_temp_correction"),
-            ("ch1_humidity_correction", "ch2_humidity_correction"),
-        ]
-        test_values = [0.0, 1.0, -2.5, 50.0]
-        for ch1_key, ch2_key in pairs:
-            ch1 = self._get_number(ch1_key)
-            ch2 = self._get_number(ch2_key)
-            for val in test_values:
-                # Skip values outside valid range for unsigned-only numbers
-                if ch1.native_min_value is not None and val < ch1.native_min_value:
-                    continue
-                assert ch1.scale_fn(val) == ch2.scale_fn(val), (
-                    f"scale_fn({val}) differs between {ch1_key} and {ch2_key}"
-                )
+        ch1 = _NUMBERS_BY_KEY[ch1_key]
+        ch2 = _NUMBERS_BY_KEY[ch2_key]
+        assert ch1.scale_fn(val) == ch2.scale_fn(val), (
+            f"scale_fn({val}) differs between {ch1_key} and {ch2_key}"
+        )
 
 
 class TestScaleFnRoundtrip:
@@ -33,47 +33,37 @@ from custom_components.jablotron_volta.scaling import (
 # ---------------------------------------------------------------------------
 
 
-class TestSignedConversion:
-    """Test to_signed_int16 / to_unsigned_int16."""
-
-    def test_positive_stays_positive(self):
-        assert to_signed_int16(100) == 100
-
-    def test_zero_stays_zero(self):
-        assert to_signed_int16(0) == 0
-
-    def test_max_positive(self):
-        assert to_signed_int16(32767) == 32767
+# Every value a 16-bit register can hold
+_UINT16_RANGE = range(0x10000)
 
-    def test_min_negative(self):
-        # 32768 = 0x8000 = -32768 as signed int16
-        assert to_signed_int16(32768) == -32768
+# (unsigned register value, signed int16) boundary pairs
+_INT16_CASES = [
+    (0, 0),
+    (100, 100),
+    (32767, 32767),  # max positive
+    (32768, -32768),  # 0x8000, min negative
+    (65535, -1),  # 0xFFFF
+    (65516, -20),  # 0xFFEC
+]
 
-    def test_minus_one(self):
-        # 65535 = 0xFFFF = -1
-        assert to_signed_int16(65535) == -1
 
-    def test_minus_twenty(self):
-        # 65516 = 0xFFEC = -20
-        assert to_signed_int16(65516) == -20
-
-    def test_unsigned_positive(self):
-        assert to_unsigned_int16(100) == 100
-
-    def test_unsigned_zero(self):
-        assert to_unsigned_int16(0) == 0
-
-    def test_unsigned_negative(self):
-        assert to_unsigned_int16(-20) == 65516
+class TestSignedConversion:
+    """Test to_signed_int16 / to_unsigned_int16."""
 
-    def test_unsigned_minus_one(self):
-        assert to_unsigned_int16(-1) == 65535
+    @pytest.mark.parametrize(("unsigned", "signed"), _INT16_CASES)
+    def test_to_signed(self, unsigned, signed):
+        assert to_signed_int16(unsigned) == signed
 
-    def test_roundtrip_positive(self):
-        assert to_unsigned_int16(to_signed_int16(215)) == 215
+    @pytest.mark.parametrize(("unsigned", "signed"), _INT16_CASES)
+    def test_to_unsigned(self, unsigned, signed):
+        assert to_unsigned_int16(signed) == unsigned
 
-    def test_roundtrip_negative(self):
-        assert to_unsigned_int16(to_signed_int16(65516)) == 65516
+    @pytest.mark.slow
+    def test_to_signed_full_sweep(self):
+        assert all(
+            to_signed_int16(x) == (x - 65536 if x > 32767 else x) for x in _UINT16_RANGE
+        )
+        assert all(to_unsigned_int16(to_signed_int16(x)) == x for x in _UINT16_RANGE)
 
 
 # ---------------------------------------------------------------------------
@@ -235,20 +225,26 @@ class TestUnscaleRatio:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.slow
 class TestRoundtrip:
-    """Test that scale -> unscale round-trips correctly."""
+    """Test that scale -> unscale round-trips for every register value."""
 
-    @pytest.mark.parametrize("reg_val", [0, 100, 215, 500, 900])
-    def test_temperature_roundtrip(self, reg_val):
-        assert unscale_temperature(scale_temperature(reg_val)) == reg_val
+    def test_temperature_roundtrip(self):
+        assert [
+            unscale_temperature(scale_temperature(v)) for v in _UINT16_RANGE
+        ] == list(_UINT16_RANGE)
 
-    @pytest.mark.parametrize("reg_val", [0, 215, 32767, 65516, 65136])
-    def test_signed_temperature_roundtrip(self, reg_val):
-        assert unscale_signed_temperature(scale_signed_temperature(reg_val)) == reg_val
+    def test_signed_temperature_roundtrip(self):
+        # Covers both halves: [0, 32767] positive, [32768, 65535] negative
+        assert [
+            unscale_signed_temperature(scale_signed_temperature(v))
+            for v in _UINT16_RANGE
+        ] == list(_UINT16_RANGE)
 
-    @pytest.mark.parametrize("reg_val", [0, 15, 30])
-    def test_pressure_roundtrip(self, reg_val):
-        assert unscale_pressure(scale_pressure(reg_val)) == reg_val
+    def test_pressure_roundtrip(self):
+        assert [unscale_pressure(scale_pressure(v)) for v in _UINT16_RANGE] == list(
+            _UINT16_RANGE
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -259,15 +255,17 @@ class TestRoundtrip:
 class TestRegistersToIp:
     """Test registers_to_ip."""
 
-    def test_normal(self):
-        # 192.168.1.100 -> reg0 = (192 << 8) | 168 = 49320, reg1 = (1 << 8) | 100 = 356
-        assert registers_to_ip(49320, 356) == "192.168.1.100"
-
-    def test_all_zeros(self):
-        assert registers_to_ip(0, 0) == "0.0.0.0"
-
-    def test_all_max(self):
-        assert registers_to_ip(0xFFFF, 0xFFFF) == "255.255.255.255"
+    @pytest.mark.parametrize(
+        ("reg0", "reg1", "expected"),
+        [
+            # 192.168.1.100 -> reg0 = (192 << 8) | 168 = 49320, reg1 = (1 << 8) | 100
+            (49320, 356, "192.168.1.100"),
+            (0, 0, "0.0.0.0"),
+            (0xFFFF, 0xFFFF, "255.255.255.255"),
+        ],
+    )
+    def test_registers_to_ip(self, reg0, reg1, expected):
+        assert registers_to_ip(reg0, reg1) == expected
 
 
 class TestIpToRegisters:
@@ -285,25 +283,27 @@ class TestIpToRegisters:
 class TestRegistersToMac:
     """Test registers_to_mac."""
 
-    def test_normal(self):
-        # 0x0011, 0x2233, 0x4455
-        result = registers_to_mac(0x0011, 0x2233, 0x4455)
-        assert result == "00:11:22:33:44:55"
-
-    def test_all_ff(self):
-        result = registers_to_mac(0xFFFF, 0xFFFF, 0xFFFF)
-        assert result == "FF:FF:FF:FF:FF:FF"
+    @pytest.mark.parametrize(
+        ("regs", "expected"),
+        [
+            ((0x0011, 0x2233, 0x4455), "00:11:22:33:44:55"),
+            ((0xFFFF, 0xFFFF, 0xFFFF), "FF:FF:FF:FF:FF:FF"),
+        ],
+    )
+    def test_registers_to_mac(self, regs, expected):
+        assert registers_to_mac(*regs) == expected
 
 
 class TestRegistersToUint32:
     """Test registers_to_uint32."""
 
-    def test_normal(self):
-        # (1 << 16) | 2 = 65538
-        assert registers_to_uint32(1, 2) == 65538
-
-    def test_zero(self):
-        assert registers_to_uint32(0, 0) == 0
-
-    def test_max(self):
-        assert registers_to_uint32(0xFFFF, 0xFFFF) == 0xFFFFFFFF
+    @pytest.mark.parametrize(
+        ("reg0", "reg1", "expected"),
+        [
+            (1, 2, 65538),  # (1 << 16) | 2
+            (0, 0, 0),
+            (0xFFFF, 0xFFFF, 0xFFFFFFFF),
+        ],
+    )
+    def test_registers_to_uint32(self, reg0, reg1, expected):
+        assert registers_to_uint32(reg0, reg1) == expected
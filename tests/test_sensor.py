@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import sys
+from collections import Counter
+
 import pytest
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
 from homeassistant.const import UnitOfTemperature
 
+from custom_components.jablotron_volta.coordinator import is_ch2_available
 from custom_components.jablotron_volta.sensor import (
+    _BASE_SENSORS,
+    _CONDITIONAL_SENSORS,
     SENSOR_TYPES,
     JablotronVoltaSensor,
 )
 
-from .conftest import _make_coordinator_data
+# Descriptor lookup shared by the tests below, built once at import
+_SENSORS_BY_KEY = {s.key: s for s in SENSOR_TYPES}
+
+
+def _native_value(coordinator, entry, description):
+    """Return native_value of a sensor entity built on the given coordinator."""
+    return JablotronVoltaSensor(coordinator, entry, description).native_value
 
 
 # ---------------------------------------------------------------------------
@@ -22,31 +34,32 @@ from .conftest import _make_coordinator_data
 def test_all_sensors_have_translation_key():
     """Test that all sensor descriptions have translation_key."""
     for sensor in SENSOR_TYPES:
-        assert hasattr(sensor, "translation_key"), (
-            f"Sensor {sensor.key} missing translation_key"
+        assert sensor.translation_key, (
+            f"Sensor {sensor.key} has empty/missing translation_key"
         )
-        assert sensor.translation_key, f"Sensor {sensor.key} has empty translation_key"
 
 
-def test_all_sensors_have_value_fn():
-    """Test that all sensor descriptions have value_fn."""
+def test_all_sensors_resolve_data_key():
+    """Test that all sensor descriptions resolve to a non-empty data key."""
     for sensor in SENSOR_TYPES:
-        assert hasattr(sensor, "value_fn"), f"Sensor {sensor.key} missing value_fn"
-        assert sensor.value_fn is not None, f"Sensor {sensor.key} has None value_fn"
+        assert sensor.data_key, f"Sensor {sensor.key} has no data key"
+        assert sensor.data_key is sys.intern(sensor.data_key), (
+            f"Sensor {sensor.key} data key is not interned"
+        )
 
 
 def test_no_duplicate_sensor_keys():
     """Test that there are no duplicate sensor keys."""
-    keys = [s.key for s in SENSOR_TYPES]
-    duplicates = [k for k in keys if keys.count(k) > 1]
-    assert not duplicates, f"Found duplicate sensor keys: {set(duplicates)}"
+    counts = Counter(s.key for s in SENSOR_TYPES)
+    duplicates = {k for k, c in counts.items() if c > 1}
+    assert not duplicates, f"Found duplicate sensor keys: {duplicates}"
 
 
 def test_no_duplicate_translation_keys():
     """Test that there are no duplicate translation keys."""
-    translation_keys = [s.translation_key for s in SENSOR_TYPES]
-    duplicates = [k for k in translation_keys if translation_keys.count(k) > 1]
-    assert not duplicates, f"Found duplicate translation keys: {set(duplicates)}"
+    counts = Counter(s.translation_key for s in SENSOR_TYPES)
+    duplicates = {k for k, c in counts.items() if c > 1}
+    assert not duplicates, f"Found duplicate translation keys: {duplicates}"
 
 
 def test_translation_keys_use_full_words():
@@ -100,8 +113,8 @@ def test_ch2_sensors_have_available_fn():
     assert len(ch2_sensors) > 0, "No CH2 sensors found"
 
     for sensor in ch2_sensors:
-        assert sensor.available_fn is not None, (
-            f"CH2 sensor {sensor.key} should have available_fn"
+        assert sensor.available_fn is is_ch2_available, (
+            f"CH2 sensor {sensor.key} should use the shared is_ch2_available"
         )
 
 
@@ -114,223 +127,138 @@ def test_non_ch2_sensors_lack_available_fn():
         )
 
 
+def test_sensor_partition_covers_all_descriptions():
+    """Base and conditional partitions together hold every description once."""
+    assert len(_BASE_SENSORS) + len(_CONDITIONAL_SENSORS) == len(SENSOR_TYPES)
+    assert set(_BASE_SENSORS) | set(_CONDITIONAL_SENSORS) == set(SENSOR_TYPES)
+    assert all(s.available_fn is not None for s in _CONDITIONAL_SENSORS)
+
+
 # ---------------------------------------------------------------------------
-# value_fn tests — use data from conftest._make_coordinator_data()
+# Data key tests — sensor entities on mock_coordinator (conftest._COORDINATOR_DATA)
 # ---------------------------------------------------------------------------
 
 
-class TestSensorValueFunctions:
-    """Test that each sensor's value_fn extracts the correct value from data."""
-
-    @pytest.fixture(autouse=True)
-    def setup_data(self):
-        """Set up coordinator data for all tests."""
-        self.data = _make_coordinator_data()
-
-    def _get_sensor(self, key: str):
-        """Look up a sensor description by key."""
-        for s in SENSOR_TYPES:
-            if s.key == key:
-                return s
-        pytest.fail(f"Sensor with key '{key}' not found in SENSOR_TYPES")
-
-    # --- Energy ---
-    def test_boiler_total_energy(self):
-        s = self._get_sensor("boiler_total_energy")
-        assert s.value_fn(self.data) == 1234
-
-    # --- System ---
-    def test_cpu_temperature(self):
-        s = self._get_sensor("cpu_temperature")
-        assert s.value_fn(self.data) == 45.5
-
-    def test_battery_voltage(self):
-        s = self._get_sensor("battery_voltage")
-        assert s.value_fn(self.data) == 3.3
-
-    # --- Outdoor ---
-    def test_outdoor_temp_damped(self):
-        s = self._get_sensor("outdoor_temp_damped")
-        assert s.value_fn(self.data) == -2.5
-
-    def test_outdoor_temp_composite(self):
-        s = self._get_sensor("outdoor_temp_composite")
-        assert s.value_fn(self.data) == -1.8
-
-    # --- Boiler ---
-    def test_boiler_pressure(self):
-        s = self._get_sensor("boiler_pressure")
-        assert s.value_fn(self.data) == 1.5
-
-    def test_boiler_water_input_temp(self):
-        s = self._get_sensor("boiler_water_input_temp")
-        assert s.value_fn(self.data) == 55.0
-
-    def test_boiler_water_return_temp(self):
-        s = self._get_sensor("boiler_water_return_temp")
-        assert s.value_fn(self.data) == 45.0
-
-    def test_boiler_water_setpoint(self):
-        s = self._get_sensor("boiler_water_setpoint")
-        assert s.value_fn(self.data) == 60.0
-
-    def test_boiler_pump_power(self):
-        s = self._get_sensor("boiler_pump_power")
-        assert s.value_fn(self.data) == 80.0
-
-    def test_boiler_heating_power(self):
-        s = self._get_sensor("boiler_heating_power")
-        assert s.value_fn(self.data) == 100.0
-
-    def test_boiler_pwm_value(self):
-        s = self._get_sensor("boiler_pwm_value")
-        assert s.value_fn(self.data) == 0
-
-    def test_boiler_active_segments(self):
-        s = self._get_sensor("boiler_active_segments")
-        assert s.value_fn(self.data) == 3
-
-    def test_boiler_inactive_segments(self):
-        s = self._get_sensor("boiler_inactive_segments")
-        assert s.value_fn(self.data) == 0
-
-    # --- DHW ---
-    def test_dhw_temperature_current(self):
-        s = self._get_sensor("dhw_temperature_current")
-        assert s.value_fn(self.data) == 48.5
-
-    # --- CH1 ---
-    def test_ch1_temperature_current(self):
-        s = self._get_sensor("ch1_temperature_current")
-        assert s.value_fn(self.data) == 21.5
-
-    def test_ch1_water_input_temp(self):
-        s = self._get_sensor("ch1_water_input_temp")
-        assert s.value_fn(self.data) == 40.0
-
-    def test_ch1_water_return_temp(self):
-        s = self._get_sensor("ch1_water_return_temp")
-        assert s.value_fn(self.data) == 35.0
-
-    def test_ch1_water_setpoint(self):
-        s = self._get_sensor("ch1_water_setpoint")
-        assert s.value_fn(self.data) == 40.0
-
-    def test_ch1_pump_power(self):
-        s = self._get_sensor("ch1_pump_power")
-        assert s.value_fn(self.data) == 30.0
-
-    def test_ch1_humidity(self):
-        s = self._get_sensor("ch1_humidity")
-        assert s.value_fn(self.data) == 55.0
-
-    def test_ch1_co2(self):
-        s = self._get_sensor("ch1_co2")
-        assert s.value_fn(self.data) == 450.0
-
-    # --- CH2 (returns None — no CH2 data in base fixture) ---
-    def test_ch2_temperature_current(self):
-        s = self._get_sensor("ch2_temperature_current")
-        assert s.value_fn(self.data) is None
-
-    def test_ch2_water_input_temp(self):
-        s = self._get_sensor("ch2_water_input_temp")
-        assert s.value_fn(self.data) is None
-
-    def test_ch2_water_return_temp(self):
-        s = self._get_sensor("ch2_water_return_temp")
-        assert s.value_fn(self.data) is None
-
-    def test_ch2_water_setpoint(self):
-        s = self._get_sensor("ch2_water_setpoint")
-        assert s.value_fn(self.data) is None
-
-    def test_ch2_pump_power(self):
-        s = self._get_sensor("ch2_pump_power")
-        assert s.value_fn(self.data) is None
-
-    def test_ch2_humidity(self):
-        s = self._get_sensor("ch2_humidity")
-        assert s.value_fn(self.data) is None
-
-    def test_ch2_co2(self):
-        s = self._get_sensor("ch2_co2")
-        assert s.value_fn(self.data) is None
-
-    # --- Network ---
-    def test_ip_address(self):
-        s = self._get_sensor("ip_address")
-        assert s.value_fn(self.data) == "192.168.1.100"
-
-    def test_subnet_mask(self):
-        s = self._get_sensor("subnet_mask")
-        assert s.value_fn(self.data) == "255.255.255.0"
-
-    def test_gateway(self):
-        s = self._get_sensor("gateway")
-        assert s.value_fn(self.data) == "192.168.1.1"
-
-
-class TestSensorValueFnWithCh2Data:
-    """Test CH2 sensor value_fn when CH2 data is present."""
-
-    def test_ch2_sensors_return_values_when_present(self):
-        data = _make_coordinator_data()
-        # Add CH2 data
-        data.update(
-            {
-                "ch2_temperature_current": 20.0,
-                "ch2_water_input_temp": 38.0,
-                "ch2_water_return_temp": 33.0,
-                "ch2_water_setpoint": 35.0,
-                "ch2_pump_power": 25.0,
-                "ch2_humidity": 60.0,
-                "ch2_co2": 500.0,
-            }
+DATA_KEY_CASES = [
+    # Energy
+    ("boiler_total_energy", 1234),
+    # System
+    ("cpu_temperature", 45.5),
+    ("battery_voltage", 3.3),
+    # Outdoor
+    ("outdoor_temp_damped", -2.5),
+    ("outdoor_temp_composite", -1.8),
+    # Boiler
+    ("boiler_pressure", 1.5),
+    ("boiler_water_input_temp", 55.0),
+    ("boiler_water_return_temp", 45.0),
+    ("boiler_water_setpoint", 60.0),
+    ("boiler_pump_power", 80.0),
+    ("boiler_heating_power", 100.0),
+    ("boiler_pwm_value", 0),
+    ("boiler_active_segments", 3),
+    ("boiler_inactive_segments", 0),
+    # DHW
+    ("dhw_temperature_current", 48.5),
+    # CH1
+    ("ch1_temperature_current", 21.5),
+    ("ch1_water_input_temp", 40.0),
+    ("ch1_water_return_temp", 35.0),
+    ("ch1_water_setpoint", 40.0),
+    ("ch1_pump_power", 30.0),
+    ("ch1_humidity", 55.0),
+    ("ch1_co2", 450.0),
+    # Network
+    ("ip_address", "192.168.1.100"),
+    ("subnet_mask", "255.255.255.0"),
+    ("gateway", "192.168.1.1"),
+]
+
+# CH2 sensors read None — no CH2 data in the base fixture
+CH2_KEYS = [
+    "ch2_temperature_current",
+    "ch2_water_input_temp",
+    "ch2_water_return_temp",
+    "ch2_water_setpoint",
+    "ch2_pump_power",
+    "ch2_humidity",
+    "ch2_co2",
+]
+
+
+@pytest.mark.parametrize(("key", "expected"), DATA_KEY_CASES)
+def test_data_key_value(key, expected, mock_coordinator, mock_config_entry):
+    """Test that each sensor reads the correct value through its data key."""
+    got = _native_value(mock_coordinator, mock_config_entry, _SENSORS_BY_KEY[key])
+    assert got == expected, f"Sensor {key} expected {expected}, got {got}"
+
+
+@pytest.mark.parametrize("key", CH2_KEYS)
+def test_ch2_data_key_without_data(key, mock_coordinator, mock_config_entry):
+    """CH2 sensors should read None when CH2 data is absent."""
+    description = _SENSORS_BY_KEY[key]
+    assert _native_value(mock_coordinator, mock_config_entry, description) is None
+
+
+# CH2 readings merged into the base data, keyed by sensor (and data) key
+CH2_EXPECTED = {
+    "ch2_temperature_current": 20.0,
+    "ch2_water_input_temp": 38.0,
+    "ch2_water_return_temp": 33.0,
+    "ch2_water_setpoint": 35.0,
+    "ch2_pump_power": 25.0,
+    "ch2_humidity": 60.0,
+    "ch2_co2": 500.0,
+}
+
+
+@pytest.fixture(scope="module")
+def ch2_data(coordinator_data):
+    """Base coordinator data plus CH2 readings, without touching the shared dict."""
+    return {**coordinator_data, **CH2_EXPECTED}
+
+
+class TestSensorDataKeyWithCh2Data:
+    """Test CH2 sensor values when CH2 data is present."""
+
+    @pytest.mark.parametrize(("key", "expected"), CH2_EXPECTED.items())
+    def test_ch2_sensors_return_values_when_present(
+        self, key, expected, ch2_data, mock_coordinator, mock_config_entry
+    ):
+        mock_coordinator.data = ch2_data
+        got = _native_value(mock_coordinator, mock_config_entry, _SENSORS_BY_KEY[key])
+        assert got == expected, f"Sensor {key} expected {expected}, got {got}"
+
+
+class TestSensorDataKeyEdgeCases:
+    """Test data key behavior with missing/empty data."""
+
+    def test_all_data_keys_read_none_for_empty_data(
+        self, mock_coordinator, mock_config_entry
+    ):
+        """Every sensor should read None when coordinator data is empty."""
+        mock_coordinator.data = {}
+        offenders = [
+            sensor.key
+            for sensor in SENSOR_TYPES
+            if _native_value(mock_coordinator, mock_config_entry, sensor) is not None
+        ]
+        assert not offenders, (
+            f"Sensors returned a value for empty data, expected None: {offenders}"
         )
 
-        ch2_keys_values = {
-            "ch2_temperature_current": 20.0,
-            "ch2_water_input_temp": 38.0,
-            "ch2_water_return_temp": 33.0,
-            "ch2_water_setpoint": 35.0,
-            "ch2_pump_power": 25.0,
-            "ch2_humidity": 60.0,
-            "ch2_co2": 500.0,
-        }
-
-        for key, expected in ch2_keys_values.items():
-            sensor = next(s for s in SENSOR_TYPES if s.key == key)
-            assert sensor.value_fn(data) == expected, (
-                f"Sensor {key} expected {expected}, got {sensor.value_fn(data)}"
-            )
-
-
-class TestSensorValueFnEdgeCases:
-    """Test value_fn behavior with missing/empty data."""
-
-    def test_all_value_fns_return_none_for_empty_data(self):
-        """Every sensor's value_fn should return None when data dict is empty."""
-        empty_data: dict = {}
-        for sensor in SENSOR_TYPES:
-            result = sensor.value_fn(empty_data)
-            assert result is None, (
-                f"Sensor {sensor.key} returned {result} for empty data, expected None"
-            )
-
-    def test_value_fn_completeness(self):
+    def test_data_key_completeness(self, mock_coordinator, mock_config_entry):
         """Every sensor key that maps to a data key should exist in conftest data.
 
         CH2 sensors are excluded because conftest only has CH1 data.
         """
-        data = _make_coordinator_data()
         for sensor in SENSOR_TYPES:
             if "ch2" in sensor.key:
                 continue  # CH2 data not in base fixture
-            result = sensor.value_fn(data)
+            result = _native_value(mock_coordinator, mock_config_entry, sensor)
             assert result is not None, (
                 f"Sensor {sensor.key} returned None — data key may be missing "
-                f"from _make_coordinator_data()"
+                f"from _COORDINATOR_DATA"
             )
 
 
@@ -351,7 +279,7 @@ def test_sensor_entity_initialization(mock_coordinator, mock_config_entry):
 
 def test_sensor_native_value(mock_coordinator, mock_config_entry):
     """Test sensor native_value property."""
-    temp_sensor_desc = next(s for s in SENSOR_TYPES if s.key == "outdoor_temp_damped")
+    temp_sensor_desc = _SENSORS_BY_KEY["outdoor_temp_damped"]
     sensor = JablotronVoltaSensor(mock_coordinator, mock_config_entry, temp_sensor_desc)
 
     assert sensor.native_value == -2.5
@@ -359,7 +287,7 @@ def test_sensor_native_value(mock_coordinator, mock_config_entry):
 
 def test_sensor_handles_missing_data(mock_coordinator, mock_config_entry):
     """Test that sensor handles missing data gracefully."""
-    temp_sensor_desc = next(s for s in SENSOR_TYPES if s.key == "outdoor_temp_damped")
+    temp_sensor_desc = _SENSORS_BY_KEY["outdoor_temp_damped"]
     mock_coordinator.data = {}
 
     sensor = JablotronVoltaSensor(mock_coordinator, mock_config_entry, temp_sensor_desc)
@@ -0,0 +1,95 @@
+"""Tests for switch entities."""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.jablotron_volta.const import REG_CH1_FAST_COOLDOWN
+from custom_components.jablotron_volta.switch import (
+    SWITCH_TYPES,
+    JablotronVoltaSwitch,
+)
+
+_SWITCHES_BY_KEY = {s.key: s for s in SWITCH_TYPES}
+
+
+@pytest.fixture
+def switch(mock_coordinator, mock_config_entry):
+    """ch1_fast_cooldown switch (off in the sample data) with state writes mocked."""
+    entity = JablotronVoltaSwitch(
+        mock_coordinator, mock_config_entry, _SWITCHES_BY_KEY["ch1_fast_cooldown"]
+    )
+    entity.async_write_ha_state = MagicMock()
+    return entity
+
+
+def test_switch_reads_state_by_key(switch, mock_coordinator):
+    """is_on reads the coordinator data key, falling back to default_bool."""
+    assert switch.is_on is False
+
+    mock_coordinator.data["ch1_fast_cooldown"] = True
+    assert switch.is_on is True
+
+    mock_coordinator.data = {}
+    assert switch.is_on is False
+
+
+@pytest.mark.asyncio
+async def test_turn_on_updates_data_optimistically(switch, mock_coordinator):
+    """A successful write flips the coordinator data and writes state once."""
+    await switch.async_turn_on()
+
+    mock_coordinator.async_write_register.assert_awaited_once_with(
+        REG_CH1_FAST_COOLDOWN, 1
+    )
+    assert mock_coordinator.data["ch1_fast_cooldown"] is True
+    switch.async_write_ha_state.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_turn_off_updates_data_optimistically(switch, mock_coordinator):
+    """Turning off writes 0 and stores False."""
+    mock_coordinator.data["ch1_fast_cooldown"] = True
+
+    await switch.async_turn_off()
+
+    mock_coordinator.async_write_register.assert_awaited_once_with(
+        REG_CH1_FAST_COOLDOWN, 0
+    )
+    assert mock_coordinator.data["ch1_fast_cooldown"] is False
+    switch.async_write_ha_state.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_write_logs_and_keeps_state(switch, mock_coordinator, caplog):
+    """A failed write leaves the data untouched and does not write state."""
+    mock_coordinator.async_write_register.return_value = False
+
+    with caplog.at_level(logging.ERROR):
+        await switch.async_turn_on()
+
+    assert mock_coordinator.data["ch1_fast_cooldown"] is False
+    switch.async_write_ha_state.assert_not_called()
+    assert "Failed to turn on ch1_fast_cooldown" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_switch_without_register_does_nothing(
+    mock_coordinator, mock_config_entry
+):
+    """Descriptions without a register never write."""
+    description = dataclasses.replace(
+        _SWITCHES_BY_KEY["ch1_fast_cooldown"], register=None
+    )
+    entity = JablotronVoltaSwitch(mock_coordinator, mock_config_entry, description)
+    entity.async_write_ha_state = MagicMock()
+
+    await entity.async_turn_on()
+
+    mock_coordinator.async_write_register.assert_not_awaited()
+    assert mock_coordinator.data["ch1_fast_cooldown"] is False
+    entity.async_write_ha_state.assert_not_called()
@@ -2,117 +2,121 @@
 
 from __future__ import annotations
 
-import json
 import re
 from pathlib import Path
+from typing import Any
 
+import pytest
 
-def get_translation_keys_from_code() -> set[str]:
-    """Extract all translation_key values from Python code."""
-    keys = set()
-    component_dir = Path("custom_components/jablotron_volta")
+from .conftest import _TRANSLATIONS_DIR
+
+# Component modules scanned for translation_key usage, listed once
+_COMPONENT_PY_FILES = tuple(
+    sorted(Path("custom_components/jablotron_volta").glob("*.py"))
+)
+
+_TKEY_RE = re.compile(rb'translation_key="([^"]+)"')
+_KEY_NAME_RE = re.compile(r"^[a-z0-9_]+$")
 
-    for py_file in component_dir.glob("*.py"):
-        content = py_file.read_text()
-        matches = re.findall(r'translation_key="([^"]+)"', content)
-        keys.update(matches)
+# Climate entities (ch1, ch2, dhw) are handled specially
+_CLIMATE_KEYS = frozenset({"ch1", "ch2", "dhw"})
 
-    return keys
+# Common abbreviations that Home Assistant expands, unless the full word follows
+_ABBREV_RE = re.compile(r"_temp(?!erature)|_pos(?!ition)|_pct")
+_ABBREV_MESSAGES = {
+    "_temp": "Use _temperature not _temp",
+    "_pos": "Use _position not _pos",
+    "_pct": "Use _percent not _pct",
+}
+
+
+def get_translation_keys_from_code() -> frozenset[str]:
+    """Extract all translation_key values from Python code."""
+    keys = set()
 
+    for py_file in _COMPONENT_PY_FILES:
+        matches = _TKEY_RE.findall(py_file.read_bytes())
+        keys.update(match.decode() for match in matches)
 
-def get_translation_keys_from_json(lang: str) -> set[str]:
-    """Extract all translation keys from JSON file."""
-    json_path = Path(f"custom_components/jablotron_volta/translations/{lang}.json")
+    return frozenset(keys)
 
-    with json_path.open() as f:
-        data = json.load(f)
 
+def get_translation_keys_from_json(translations: dict[str, Any]) -> frozenset[str]:
+    """Extract all entity translation keys from a parsed translation file."""
     keys = set()
-    for domain in data.get("entity", {}).values():
+    for domain in translations.get("entity", {}).values():
         keys.update(domain.keys())
 
-    return keys
+    return frozenset(keys)
+
+
+@pytest.fixture(scope="session")
+def code_keys() -> frozenset[str]:
+    """translation_key values used in the component code."""
+    return get_translation_keys_from_code()
+
+
+@pytest.fixture(scope="session")
+def en_keys(en_translations) -> frozenset[str]:
+    """Entity translation keys defined in en.json."""
+    return get_translation_keys_from_json(en_translations)
+
+
+@pytest.fixture(scope="session")
+def cs_keys(cs_translations) -> frozenset[str]:
+    """Entity translation keys defined in cs.json."""
+    return get_translation_keys_from_json(cs_translations)
 
 
 def test_translation_files_exist():
     """Test that translation files exist."""
-    en_path = Path("custom_components/jablotron_volta/translations/en.json")
-    cs_path = Path("custom_components/jablotron_volta/translations/cs.json")
+    en_path = _TRANSLATIONS_DIR / "en.json"
+    cs_path = _TRANSLATIONS_DIR / "cs.json"
 
     assert en_path.exists(), "en.json translation file missing"
     assert cs_path.exists(), "cs.json translation file missing"
 
 
-def test_translation_files_valid_json():
+def test_translation_files_valid_json(en_translations, cs_translations):
     """Test that translation files are valid JSON."""
-    en_path = Path("custom_components/jablotron_volta/translations/en.json")
-    cs_path = Path("custom_components/jablotron_volta/translations/cs.json")
-
-    with en_path.open() as f:
-        en_data = json.load(f)
+    assert "entity" in en_translations, "en.json missing 'entity' key"
+    assert "entity" in cs_translations, "cs.json missing 'entity' key"
 
-    with cs_path.open() as f:
-        cs_data = json.load(f)
 
-    assert "entity" in en_data, "en.json missing 'entity' key"
-    assert "entity" in cs_data, "cs.json missing 'entity' key"
-
-
-def test_translation_keys_match_between_languages():
+def test_translation_keys_match_between_languages(en_keys, cs_keys):
     """Test that en.json and cs.json have the same keys."""
-    en_keys = get_translation_keys_from_json("en")
-    cs_keys = get_translation_keys_from_json("cs")
-
-    # Climate entities (ch1, ch2, dhw) are handled specially
-    climate_keys = {"ch1", "ch2", "dhw"}
-
-    missing_in_cs = en_keys - cs_keys - climate_keys
-    missing_in_en = cs_keys - en_keys - climate_keys
+    missing_in_cs = en_keys - cs_keys - _CLIMATE_KEYS
+    missing_in_en = cs_keys - en_keys - _CLIMATE_KEYS
 
     assert not missing_in_cs, f"Keys in en.json but missing in cs.json: {missing_in_cs}"
     assert not missing_in_en, f"Keys in cs.json but missing in en.json: {missing_in_en}"
 
 
-def test_code_translation_keys_exist_in_json():
+def test_code_translation_keys_exist_in_json(code_keys, en_keys):
     """Test that all translation_key values from code exist in en.json."""
-    code_keys = get_translation_keys_from_code()
-    json_keys = get_translation_keys_from_json("en")
-
-    missing = code_keys - json_keys
+    missing = code_keys - en_keys
 
     assert not missing, f"translation_key in code but missing in en.json: {missing}"
 
 
-def test_no_abbreviations_in_translation_keys():
+def test_no_abbreviations_in_translation_keys(code_keys):
     """Test that translation_key values don't use abbreviations."""
-    code_keys = get_translation_keys_from_code()
-
-    # Common abbreviations that Home Assistant expands
-    forbidden_patterns = [
-        ("_temp", "_temperature", "Use _temperature not _temp"),
-        ("_pos", "_position", "Use _position not _pos"),
-        ("_pct", "_percent", "Use _percent not _pct"),
+    issues = [
+        f"{key}: {_ABBREV_MESSAGES[match.group()]}"
+        for key in sorted(code_keys)
+        for match in _ABBREV_RE.finditer(key)
     ]
 
-    issues = []
-
-    for key in code_keys:
-        for abbrev, full, message in forbidden_patterns:
-            if abbrev in key and full not in key:
-                issues.append(f"{key}: {message}")
-
     assert not issues, "Found translation_key abbreviations:\n" + "\n".join(issues)
 
 
-def test_translation_key_naming_convention():
+def test_translation_key_naming_convention(code_keys):
     """Test that translation_key values follow naming conventions."""
-    code_keys = get_translation_keys_from_code()
-
     issues = []
 
     for key in code_keys:
         # Should be lowercase with underscores
-        if not re.match(r"^[a-z0-9_]+$", key):
+        if not _KEY_NAME_RE.match(key):
             issues.append(f"{key}: Should be lowercase with underscores only")
 
         # Should not start or end with underscore
@@ -126,16 +130,11 @@ def test_translation_key_naming_convention():
     assert not issues, "Translation key naming issues:\n" + "\n".join(issues)
 
 
-def test_all_translations_have_name_property():
+def test_all_translations_have_name_property(en_translations):
     """Test that all translation entries have a 'name' property."""
-    en_path = Path("custom_components/jablotron_volta/translations/en.json")
-
-    with en_path.open() as f:
-        data = json.load(f)
-
     issues = []
 
-    for domain_name, domain_data in data.get("entity", {}).items():
+    for domain_name, domain_data in en_translations.get("entity", {}).items():
         for key, value in domain_data.items():
             if "name" not in value:
                 issues.append(f"{domain_name}.{key}: Missing 'name' property")
@@ -145,16 +144,11 @@ def test_all_translations_have_name_property():
     assert not issues, "Translation entries missing 'name':\n" + "\n".join(issues)
 
 
-def test_translation_coverage():
+def test_translation_coverage(code_keys, en_keys):
     """Test that we have good translation coverage."""
-    code_keys = get_translation_keys_from_code()
-    json_keys = get_translation_keys_from_json("en")
-
     # Should have at least 70 entity translations
-    assert len(json_keys) >= 70, (
-        f"Expected at least 70 translations, got {len(json_keys)}"
-    )
+    assert len(en_keys) >= 70, f"Expected at least 70 translations, got {len(en_keys)}"
 
     # At least 90% of code keys should be in translations
-    coverage = len(code_keys & json_keys) / len(code_keys) * 100
+    coverage = len(code_keys & en_keys) / len(code_keys) * 100
     assert coverage >= 90, f"Translation coverage is {coverage:.1f}%, expected >= 90%"